@@ -1,12 +1,38 @@
 import os
+import re
+import logging
+import threading
+import base64
+import errno
+import secrets
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 import flask
-from flask import Flask, render_template, request, redirect, jsonify
-import requests
-from flask_sqlalchemy import SQLAlchemy
-from bs4 import BeautifulSoup
-import validators 
+from functools import partial
+from flask import (Blueprint, Flask, Response, current_app, render_template, request, redirect,
+                   jsonify, flash, stream_with_context)
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+from title_worker import TitleWorker
+from models import db, User, URL, Tag, URLTag, is_broken
+from tag_registry import tag_registry
+from fuzzy_index import fuzzy_index
+from response_cache import ResponseCache
+from schema_migrations import run_migrations
+from urlnorm import url_hash
+from bulk_import import detect_format, import_file
+import bulk_export
+import metrics
 
-app = Flask(__name__)
+# ✅ LAZY IMPORTS - requests / validators / rapidfuzz sirf tab load hote hain jab
+# /add, title fetch, link check ya fuzzy search pehli baar chale. Har gunicorn worker
+# ka boot time aur memory kam (benchmarks/bench_startup.py).
+
+# ✅ LOGGING - LOG_LEVEL=DEBUG se debug lines dikhengi, production me INFO/WARNING
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+                    format='%(asctime)s level=%(levelname)s logger=%(name)s %(message)s')
+log = logging.getLogger('url_manager')
 
 # ✅ PRODUCTION-READY DATABASE CONFIG
 def get_database_uri():
@@ -20,44 +46,256 @@ def get_database_uri():
         # Development - SQLite (temporary)
         return 'sqlite:///url_manager.db'
 
-app.config['SQLALCHEMY_DATABASE_URI'] = get_database_uri()
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-
-db = SQLAlchemy(app)
-
-# ✅ MODELS (TERA EXISTING CODE - BILKUL SAME)
-class User(db.Model):
-    __tablename__ = 'user'
-    id = db.Column(db.Integer, primary_key=True)
-    email = db.Column(db.String(100), unique=True, nullable=False)
-    password_hash = db.Column(db.String(200), nullable=False)
-    created_at = db.Column(db.DateTime, default=db.func.now())
-
-# ✅ URL MODEL (WITH USER_ID)
-class URL(db.Model):
-    __tablename__ = 'url'
-    id = db.Column(db.Integer, primary_key=True)
-    url = db.Column(db.String(500))
-    title = db.Column(db.String(200))
-    is_archived = db.Column(db.Boolean, default=False)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'))  # ✅ FOREIGN KEY
-    created_at = db.Column(db.DateTime, default=db.func.now())
-
-class Tag(db.Model):
-    __tablename__ = 'tag'
-    id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(50), unique=True)
-    color = db.Column(db.String(7))
-
-class URLTag(db.Model):
-    __tablename__ = 'urltag'
-    id = db.Column(db.Integer, primary_key=True)
-    url_id = db.Column(db.Integer, db.ForeignKey('url.id'))
-    tag_id = db.Column(db.Integer, db.ForeignKey('tag.id'))
-    
+# ✅ SEARCH BACKEND - database ke hisaab se full-text index
+def get_search_backend(uri):
+    if uri.startswith('postgresql'):
+        return 'postgres'   # tsvector column + GIN index
+    if uri.startswith('sqlite'):
+        return 'sqlite'     # FTS5 virtual table + triggers
+    return 'like'           # koi FTS nahi - ILIKE fallback
+
+# ✅ SECRET KEY - production (Postgres) me SECRET_KEY env zaroori hai; source me likha
+# default key se koi bhi session cookie / flash forge kar sakta tha. Local SQLite pe
+# har process ka random key (restart pe sirf flash messages / session reset hote hain).
+def get_fallback_secret_key(uri):
+    if not uri.startswith('sqlite'):
+        raise RuntimeError('SECRET_KEY environment variable must be set for a production database')
+    log.warning('SECRET_KEY not set - using a random per-process key (development only)')
+    return secrets.token_hex(32)
+
+# ✅ ENGINE TUNING - backend ke hisaab se connection pool / pragmas
+SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000))
+
+def get_engine_options(uri):
+    if uri.startswith('postgresql'):
+        return {
+            'pool_size': int(os.environ.get('DB_POOL_SIZE', 5)),
+            'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+            'pool_pre_ping': True,     # host ne idle connection kaat diya ho to request fail na ho
+            'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+        }
+    if uri.startswith('sqlite'):
+        # pysqlite ka apna lock wait - pragma se pehle wale statements ke liye bhi
+        return {'connect_args': {'timeout': SQLITE_BUSY_TIMEOUT_MS / 1000}}
+    return {}
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    # Har nayi connection pe - WAL me readers writer ko block nahi karte, aur
+    # doosre worker ka write lock ho to turant "database is locked" ki jagah wait
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute(f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}')
+    cursor.execute('PRAGMA synchronous=NORMAL')    # WAL me safe, har commit pe fsync nahi
+    cursor.close()
+
+# ✅ FULL-TEXT SEARCH INDEX - idempotent, init_db() me chalta hai
+# Postgres: generated tsvector column (title + url ke words) + GIN index
+# SQLite: external-content FTS5 table, triggers se url table ke saath sync
+POSTGRES_SEARCH_DDL = [
+    """ALTER TABLE url ADD COLUMN IF NOT EXISTS search_vector tsvector
+       GENERATED ALWAYS AS (
+           to_tsvector('simple', coalesce(title, '') || ' ' ||
+                       regexp_replace(coalesce(url, ''), '[^[:alnum:]]+', ' ', 'g'))
+       ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_url_search_vector ON url USING GIN (search_vector)",
+]
+
+SQLITE_SEARCH_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS url_fts USING fts5(
+           title, url, content='url', content_rowid='id', tokenize='unicode61'
+       )""",
+    """CREATE TRIGGER IF NOT EXISTS url_fts_ai AFTER INSERT ON url BEGIN
+           INSERT INTO url_fts(rowid, title, url) VALUES (new.id, new.title, new.url);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS url_fts_ad AFTER DELETE ON url BEGIN
+           INSERT INTO url_fts(url_fts, rowid, title, url) VALUES ('delete', old.id, old.title, old.url);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS url_fts_au AFTER UPDATE OF title, url ON url BEGIN
+           INSERT INTO url_fts(url_fts, rowid, title, url) VALUES ('delete', old.id, old.title, old.url);
+           INSERT INTO url_fts(rowid, title, url) VALUES (new.id, new.title, new.url);
+       END""",
+]
+
+def setup_search_index():
+    backend = current_app.config['SEARCH_BACKEND']
+    with db.engine.begin() as conn:
+        if backend == 'postgres':
+            for ddl in POSTGRES_SEARCH_DDL:
+                conn.execute(db.text(ddl))
+        elif backend == 'sqlite':
+            existed = conn.execute(db.text(
+                "SELECT 1 FROM sqlite_master WHERE name = 'url_fts'")).first()
+            for ddl in SQLITE_SEARCH_DDL:
+                conn.execute(db.text(ddl))
+            if not existed:
+                # Pehle se saved URLs ko bhi index me daalo
+                conn.execute(db.text("INSERT INTO url_fts(url_fts) VALUES ('rebuild')"))
+
+# ✅ SCHEMA + SEED INIT - idempotent, boot pe ek lock ke neeche
+# Kai gunicorn workers ek saath boot hon to bhi ek hi waqt pe ek hi chalata hai:
+# Postgres advisory lock / SQLite lock file. Baaki wait karte hain, phir sab pehle
+# se bana milta hai (har step "agar nahi hai to banao" hai).
+DEFAULT_TAGS = [
+    ('work', '#3B82F6'),
+    ('programming', '#10B981'),
+    ('research', '#8B5CF6'),
+    ('personal', '#F59E0B'),
+    ('news', '#EF4444')
+]
+DEFAULT_USER_EMAIL = 'default@example.com'
+INIT_LOCK_KEY = 0x75726c6d   # pg_advisory_lock key ('urlm')
+
+@contextmanager
+def init_lock():
+    if db.engine.dialect.name == 'postgresql':
+        with db.engine.connect() as conn:
+            conn.execute(db.text('SELECT pg_advisory_lock(:key)'), {'key': INIT_LOCK_KEY})
+            try:
+                yield
+            finally:
+                conn.execute(db.text('SELECT pg_advisory_unlock(:key)'), {'key': INIT_LOCK_KEY})
+    elif db.engine.dialect.name == 'sqlite' and db.engine.url.database not in (None, '', ':memory:'):
+        with open(f'{db.engine.url.database}.init.lock', 'a+') as lock_file:
+            lock_file_exclusive(lock_file)
+            try:
+                yield
+            finally:
+                unlock_file(lock_file)
+    else:
+        yield
+
+# ✅ FILE LOCK - Linux / macOS pe fcntl.flock, Windows (local dev) pe msvcrt byte lock
+def lock_file_exclusive(lock_file):
+    try:
+        import fcntl
+    except ImportError:
+        import msvcrt
+        lock_file.seek(0)
+        while True:
+            try:
+                # LK_LOCK ~10 s tak retry karta hai, phir EDEADLOCK / EACCES - tab dobara wait
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError as e:
+                if e.errno in (errno.EDEADLOCK, errno.EACCES):
+                    log.info('waiting for init lock file=%s', lock_file.name)
+                    continue
+                log.error('init lock failed file=%s error=%s', lock_file.name, e)
+                raise
+    fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+def unlock_file(lock_file):
+    try:
+        import fcntl
+    except ImportError:
+        import msvcrt
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        return
+    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def seed_defaults():
+    existing = {name for (name,) in db.session.query(Tag.name)}
+    for name, color in DEFAULT_TAGS:
+        if name not in existing:
+            db.session.add(Tag(name=name, color=color))
+            log.info('tag created name=%s', name)
+
+    # /add aur bulk import isi user ke naam se save karte hain
+    if not db.session.query(User.id).filter_by(email=DEFAULT_USER_EMAIL).first():
+        db.session.add(User(email=DEFAULT_USER_EMAIL, password_hash='!'))  # '!' = login possible nahi
+        log.info('default user created email=%s', DEFAULT_USER_EMAIL)
+    db.session.commit()
+
+def init_db():
+    with init_lock():
+        db.create_all()
+        applied = run_migrations()  # purane DB pe naye columns / indexes (schema_migrations.py)
+        setup_search_index()
+        seed_defaults()
+    log.info('database ready migrations_applied=%d search_backend=%s',
+             len(applied), current_app.config['SEARCH_BACKEND'])
+
+# ✅ APP FACTORY - config, engine tuning, instrumentation aur DB init ek jagah
+# gunicorn app:app neeche wala module-level app use karta hai; INIT_DB_ON_STARTUP=0 ho
+# to init sirf `flask --app app init-db` (deploy / release step) se hota hai.
+def create_app(config=None):
+    app = Flask(__name__)
+
+    app.config['SQLALCHEMY_DATABASE_URI'] = get_database_uri()
+    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY')  # flash() / session cookie sign
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # QUERY_COUNT_DEBUG=1 set karo to response me X-Query-Count / X-Query-Time-Ms headers aayenge
+    app.config['QUERY_COUNT_DEBUG'] = os.environ.get('QUERY_COUNT_DEBUG') == '1'
+    app.config['INIT_DB_ON_STARTUP'] = os.environ.get('INIT_DB_ON_STARTUP', '1') == '1'
+    # Multiple gunicorn workers ho to RESPONSE_CACHE_BACKEND=database
+    app.config['RESPONSE_CACHE_BACKEND'] = os.environ.get('RESPONSE_CACHE_BACKEND', 'local')
+    app.config['RESPONSE_CACHE_ENTRIES'] = int(os.environ.get('RESPONSE_CACHE_ENTRIES', 256))
+    app.config['RESPONSE_CACHE_BYTES'] = int(os.environ.get('RESPONSE_CACHE_BYTES', 32 * 1024 * 1024))
+    app.config.update(config or {})
+
+    uri = app.config['SQLALCHEMY_DATABASE_URI']
+    if not app.config['SECRET_KEY']:
+        app.config['SECRET_KEY'] = get_fallback_secret_key(uri)
+    app.config.setdefault('SEARCH_BACKEND', get_search_backend(uri))
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', get_engine_options(uri))
+
+    db.init_app(app)
+    response_cache.init_app(app)
+    app.extensions['title_worker'] = create_title_worker(app)
+    app.register_blueprint(bp)
+
+    with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            event.listen(db.engine, 'connect', set_sqlite_pragmas)
+
+        # ✅ INSTRUMENTATION - route latency, SQL count/time per request, title fetch spans
+        # (metrics.py, /metrics pe Prometheus format)
+        metrics.init_app(app, db.engine)
+
+        if app.config['INIT_DB_ON_STARTUP']:
+            init_db()
+
+    @app.cli.command('init-db')
+    def init_db_command():
+        """Create tables, apply migrations, build the search index and seed defaults."""
+        init_db()
 
+    return app
 
-@app.route('/check-tables')
+# ✅ `gunicorn app:app` / `from app import app` (CLIs) - module import pe app nahi banta,
+# pehli baar `app` maangne pe create_app() chalta hai. Tests apna create_app(config) banate hain.
+def __getattr__(name):
+    if name == 'app':
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# ✅ ROUTES - blueprint pe, create_app() har app pe register karta hai
+bp = Blueprint('main', __name__)
+
+# ✅ PAGINATION CONFIG - har section me ek baar me kitne URLs
+PAGE_SIZE = int(os.environ.get('PAGE_SIZE', 50))
+MAX_PAGE_SIZE = 200
+SEARCH_LIMIT = int(os.environ.get('SEARCH_LIMIT', 100))
+
+# ✅ RESPONSE CACHE - har app ka apna store (response_cache.py, create_app -> init_app)
+response_cache = ResponseCache()
+
+# ✅ DEBUG QUERY COUNTER - har request kitni SQL queries chalata hai
+@bp.after_app_request
+def add_query_count_header(response):
+    if current_app.config['QUERY_COUNT_DEBUG']:
+        response.headers['X-Query-Count'] = str(flask.g.get('query_count', 0))
+        response.headers['X-Query-Time-Ms'] = f"{flask.g.get('query_time', 0.0) * 1000:.2f}"
+    return response
+
+@bp.route('/metrics')
+def metrics_endpoint():
+    return Response(metrics.registry.render(), mimetype='text/plain; version=0.0.4')
+
+@bp.route('/check-tables')
 def check_tables():
     try:
         # Check if tables exist (new method)
@@ -83,155 +321,407 @@ def check_tables():
     
     
     
-# ✅ AUTO CREATE TABLES & TAGS
-@app.route('/start')
+# ✅ MANUAL INIT - boot pe init_db() aur pending titles ka requeue pehle hi ho chuka
+# hota hai; yeh route dono ko haath se dobara chalane ke liye hai
+@bp.route('/start')
+@response_cache.invalidates
 def initialize():
     try:
-        db.create_all()
-        print("✅ Database tables created")
-        
-        # Auto-create tags
-        tags_data = [
-            ('work', '#3B82F6'),
-            ('programming', '#10B981'),
-            ('research', '#8B5CF6'),
-            ('personal', '#F59E0B'),
-            ('news', '#EF4444')
-        ]
-        
-        for name, color in tags_data:
-            if not Tag.query.filter_by(name=name).first():
-                tag = Tag(name=name, color=color)
-                db.session.add(tag)
-                print(f"✅ Tag created: {name}")
-        
-        db.session.commit()
-        print("✅ Tags initialized successfully!")
-        
+        init_db()
+        # Restart se pehle jo titles pending reh gaye (aur kisi worker ke paas nahi) unko queue karo
+        requeue_pending_titles()
+        return "✅ Database initialized (tables, migrations, search index, default tags and user)"
     except Exception as e:
-        print(f"❌ Initialization error: {e}")
+        log.exception('initialization failed error=%s', e)
         db.session.rollback()
+        return f"Error: {str(e)}", 500
+
+# ✅ KEYSET PAGINATION - (created_at, id) cursor, OFFSET wala full scan nahi
+def encode_cursor(url):
+    raw = f"{url.created_at.isoformat()}|{url.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, url_id = raw.rsplit('|', 1)
+        return datetime.fromisoformat(created_at), int(url_id)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+def paginate_urls(query, cursor=None, limit=PAGE_SIZE):
+    query = query.order_by(URL.created_at.desc(), URL.id.desc())
+    position = decode_cursor(cursor) if cursor else None
+    if position:
+        query = query.filter(db.tuple_(URL.created_at, URL.id) < position)
+
+    # Ek extra row fetch karo - pata chal jayega ki agla page hai ya nahi
+    rows = query.options(selectinload(URL.tags)).limit(limit + 1).all()
+    next_cursor = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+def section_query(is_archived):
+    return URL.query.filter_by(is_archived=is_archived)
+
+# ✅ RANKED SEARCH - ek hi query, active + archived dono, rank ke order me
+def search_terms(search_query):
+    # Sirf word characters - FTS5 / tsquery syntax inject nahi ho sakta
+    return re.findall(r'\w+', search_query.lower())
+
+def ranked_search_query(search_query):
+    terms = search_terms(search_query)
+    backend = current_app.config['SEARCH_BACKEND']
+
+    if backend == 'postgres':
+        # Har word prefix match kare: 'git' -> github bhi mile
+        tsquery = db.func.to_tsquery('simple', ' & '.join(f'{term}:*' for term in terms))
+        vector = db.literal_column('url.search_vector')
+        rank = db.func.ts_rank(vector, tsquery)
+        query = db.session.query(URL).filter(vector.op('@@')(tsquery))
+    elif backend == 'sqlite':
+        fts = db.table('url_fts', db.column('rowid'))
+        rank = -db.func.bm25(db.literal_column('url_fts'))  # bm25 me kam = better
+        match = ' '.join(f'"{term}"*' for term in terms)
+        query = db.session.query(URL).join(fts, fts.c.rowid == URL.id).filter(
+            db.literal_column('url_fts').op('MATCH')(match))
+    else:
+        rank = db.literal(0)
+        query = db.session.query(URL)
+        for term in terms:
+            query = query.filter(db.or_(URL.title.ilike(f'%{term}%'),
+                                        URL.url.ilike(f'%{term}%')))
+
+    return query.order_by(rank.desc(), URL.id.desc())
+
+def search_urls(search_query, limit=SEARCH_LIMIT, offset=0, is_archived=None):
+    if not search_terms(search_query):
+        return [], False
+    query = ranked_search_query(search_query)
+    if is_archived is not None:
+        query = query.filter(URL.is_archived == is_archived)
+    rows = query.options(selectinload(URL.tags)).offset(offset).limit(limit + 1).all()
+    return rows[:limit], len(rows) > limit
+
+# ✅ FUZZY SEARCH - typo-tolerant, in-process index (fuzzy_index.py)
+def fuzzy_search_urls(search_query, limit=SEARCH_LIMIT, is_archived=None):
+    hits = fuzzy_index.search(search_query, limit, is_archived)
+    if not hits:
+        return []
+    rows = (URL.query.options(selectinload(URL.tags))
+            .filter(URL.id.in_([url_id for url_id, _ in hits])).all())
+    by_id = {url.id: url for url in rows}
+    return [by_id[url_id] for url_id, _ in hits if url_id in by_id]
+
+def url_to_dict(url):
+    # Tags pehle se loaded hain (selectinload), koi extra query nahi
+    return {
+        'id': url.id,
+        'url': url.url,
+        'title': url.title,
+        'title_status': url.title_status or 'ready',
+        'is_archived': bool(url.is_archived),
+        'http_status': url.http_status,
+        'is_broken': is_broken(url.http_status),
+        'tags': [tag.name for tag in url.tags]
+    }
 
 # ✅ SEARCH FUNCTIONALITY ADDED - TERA EXISTING INDEX ROUTE MODIFIED
-@app.route('/')
-@app.route('/search')  # Dono routes handle karega
+@bp.route('/')
+@bp.route('/search')  # Dono routes handle karega
+@response_cache.cached
 def index():
     search_query = request.args.get('q', '').strip()
-    
-    # Search BOTH active and archived URLs
-    if search_query and not search_query.isspace():
-        # Active URLs that match search
-        active_results = URL.query.filter(
-            db.or_(
-                URL.title.ilike(f'%{search_query}%'),
-                URL.url.ilike(f'%{search_query}%')
-            )
-        ).filter_by(is_archived=False).all()
-        
-        # Archived URLs that match search  
-        archived_results = URL.query.filter(
-            db.or_(
-                URL.title.ilike(f'%{search_query}%'),
-                URL.url.ilike(f'%{search_query}%')
-            )
-        ).filter_by(is_archived=True).all()
-        
-        is_searching = True
+    search_mode = 'fuzzy' if request.args.get('mode') == 'fuzzy' else 'fulltext'
+    is_searching = bool(search_query)
+    active_cursor = request.args.get('active_cursor')
+    archived_cursor = request.args.get('archived_cursor')
+
+    if is_searching:
+        # Search: ek ranked query, top SEARCH_LIMIT results, phir split
+        if search_mode == 'fuzzy':
+            results = fuzzy_search_urls(search_query)
+        else:
+            results, _ = search_urls(search_query)
+        active_urls = [url_to_dict(url) for url in results if not url.is_archived]
+        archived_urls = [url_to_dict(url) for url in results if url.is_archived]
+        active_cursor = archived_cursor = None
+        next_active_cursor = next_archived_cursor = None
     else:
-        # No search - show all active and archived separately
-        active_results = URL.query.filter_by(is_archived=False).all()
-        archived_results = URL.query.filter_by(is_archived=True).all()
-        is_searching = False
-    
-    # Convert to dict (TERA EXISTING CODE)
-    def convert_to_dict(urls):
-        result = []
-        for url in urls:
-            url_tags = URLTag.query.filter_by(url_id=url.id).all()
-            tag_names = []
-            for url_tag in url_tags:
-                tag = Tag.query.get(url_tag.tag_id)
-                if tag:
-                    tag_names.append(tag.name)
-            result.append({
-                'id': url.id,
-                'url': url.url,
-                'title': url.title,
-                'tags': tag_names
-            })
-        return result
-    
-    active_urls = convert_to_dict(active_results)
-    archived_urls = convert_to_dict(archived_results)
+        # Sirf pehla page (ya cursor wala page) load hota hai - poora collection nahi
+        active_results, next_active_cursor = paginate_urls(
+            section_query(False), active_cursor)
+        archived_results, next_archived_cursor = paginate_urls(
+            section_query(True), archived_cursor)
+
+        active_urls = [url_to_dict(url) for url in active_results]
+        archived_urls = [url_to_dict(url) for url in archived_results]
     
-    # Tag colors for display
-    tag_colors = {
-        'work': '#3B82F6',
-        'programming': '#10B981',
-        'research': '#8B5CF6',
-        'personal': '#F59E0B',
-        'news': '#EF4444'
-    }
+    # Tag colors for display - registry se, DB wali Tag.color
+    tag_colors = tag_registry.colors()
     
     return render_template('index.html', 
                          urls=active_urls,
                          archived_urls=archived_urls,
                          search_query=search_query,
                          is_searching=is_searching,
+                         search_mode=search_mode,
+                         active_cursor=active_cursor,
+                         archived_cursor=archived_cursor,
+                         next_active_cursor=next_active_cursor,
+                         next_archived_cursor=next_archived_cursor,
                          tag_colors=tag_colors)
 
+# ✅ JSON API - ek page + next cursor
+@bp.route('/api/urls')
+@response_cache.cached
+def api_urls():
+    search_query = request.args.get('q', '').strip()
+    section = request.args.get('section', 'active')
+    if section not in ('active', 'archived'):
+        return jsonify({'error': "section must be 'active' or 'archived'"}), 400
+
+    try:
+        limit = min(max(int(request.args.get('limit', PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+
+    cursor = request.args.get('cursor')
+    if search_query:
+        # Ranked results ka cursor sirf offset hai - matches chhote set pe hi chalta hai
+        try:
+            offset = max(int(cursor or 0), 0)
+        except ValueError:
+            return jsonify({'error': 'invalid cursor'}), 400
+        results, has_more = search_urls(search_query, limit, offset,
+                                        is_archived=(section == 'archived'))
+        next_cursor = str(offset + limit) if has_more else None
+    else:
+        # Kharab cursor pe pehla page dena loop bana deta (naya next_cursor milta rehta)
+        if cursor and decode_cursor(cursor) is None:
+            return jsonify({'error': 'invalid cursor'}), 400
+        results, next_cursor = paginate_urls(section_query(section == 'archived'),
+                                             cursor, limit)
+
+    return jsonify({
+        'section': section,
+        'urls': [url_to_dict(url) for url in results],
+        'next_cursor': next_cursor
+    })
+
+# ✅ AUTOCOMPLETE - search box ke liye top fuzzy matches (cache nahi - har keystroke alag)
+@bp.route('/api/autocomplete')
+def autocomplete():
+    search_query = request.args.get('q', '').strip()
+    try:
+        limit = min(max(int(request.args.get('limit', 8)), 1), 20)
+    except ValueError:
+        return jsonify({'error': 'limit must be an integer'}), 400
+
+    hits = fuzzy_index.search(search_query, limit) if search_query else []
+    rows = {}
+    if hits:
+        rows = {row.id: row for row in db.session.query(URL.id, URL.url, URL.title, URL.is_archived)
+                .filter(URL.id.in_([url_id for url_id, _ in hits]))}
+    return jsonify({
+        'query': search_query,
+        'suggestions': [{
+            'id': url_id,
+            'url': rows[url_id].url,
+            'title': rows[url_id].title,
+            'is_archived': bool(rows[url_id].is_archived),
+            'score': score,
+        } for url_id, score in hits if url_id in rows]
+    })
+
+# ✅ TITLE SCRAPING - background worker me chalta hai, request handler me nahi
+# (streaming <head>-only extractor + pooled session + cache: title_extractor.py)
+def save_fetched_title(app, url_id, title, status):
+    with app.app_context():
+        url = db.session.get(URL, url_id)
+        if url:
+            url.title = title
+            url.title_status = status
+            db.session.commit()
+            response_cache.bump()   # pending -> title, cached pages purane ho gaye
+
+def fetch_page_title(url):
+    from title_extractor import fetch_title    # requests / cachetools pehle fetch pe load
+    return fetch_title(url)
+
+# ✅ TITLE LEASE - pending title jis process ke title_worker me queue hai woh
+# url.title_claimed_at pe lease rakhta hai aur har TITLE_LEASE_SECONDS / 3 pe renew
+# karta hai. Doosra worker (boot / /start) sirf bina lease ya expired lease wale rows
+# claim karta hai - busy sibling ke queued titles dobara fetch nahi hote, aur mare hue
+# worker ke titles lease khatam hote hi wapas mil jaate hain.
+TITLE_LEASE_SECONDS = int(os.environ.get('TITLE_LEASE_SECONDS', 300))
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+def renew_title_leases(app, url_ids):
+    with app.app_context():
+        db.session.execute(db.update(URL)
+                           .where(URL.id.in_(url_ids), URL.title_status == 'pending')
+                           .values(title_claimed_at=_utcnow()))
+        db.session.commit()
+
+def create_title_worker(app):
+    return TitleWorker(
+        metrics.timed_fetch(fetch_page_title), partial(save_fetched_title, app),
+        max_workers=int(os.environ.get('TITLE_FETCH_WORKERS', 8)),
+        per_host=int(os.environ.get('TITLE_FETCH_PER_HOST', 2)),
+        retries=int(os.environ.get('TITLE_FETCH_RETRIES', 3)),
+        on_lease=partial(renew_title_leases, app),
+        lease_interval=TITLE_LEASE_SECONDS / 3,
+    )
+
+def get_title_worker():
+    return current_app.extensions['title_worker']
+
+def claim_pending_titles():
+    # Ek hi UPDATE ... RETURNING - do workers ek saath chalein to bhi har row ek ko milti hai
+    now = _utcnow()
+    expired = now - timedelta(seconds=TITLE_LEASE_SECONDS)
+    rows = db.session.execute(
+        db.update(URL)
+        .where(URL.title_status == 'pending',
+               db.or_(URL.title_claimed_at.is_(None), URL.title_claimed_at < expired))
+        .values(title_claimed_at=now)
+        .returning(URL.id, URL.url)).all()
+    db.session.commit()
+    return rows
+
+def requeue_pending_titles():
+    # Restart / crash se adhoore title fetch - gunicorn post_worker_init hook
+    # (gunicorn.conf.py), `python app.py` aur /start se; CLIs se nahi
+    title_worker = get_title_worker()
+    rows = claim_pending_titles()
+    for url_id, url in rows:
+        title_worker.submit(url_id, url)
+    if rows:
+        log.info('pending titles requeued count=%d', len(rows))
+    return len(rows)
+
 # ✅ TERA EXISTING ROUTES - BILKUL SAME RAHEGA
-@app.route('/add', methods=['POST'])
+@bp.route('/add', methods=['POST'])
+@response_cache.invalidates
 def add_url():
     try:
         url = request.form['url']
         tags = request.form.get('tags', '').split(',')
         tags = [tag.strip() for tag in tags if tag.strip()]
         
-        print(f"🎯 DEBUG: URL: {url}, Tags: {tags}")
+        log.debug('add_url url=%s tags=%s', url, tags)
         
+        import validators   # pehle /add pe load - worker boot me nahi
         if not validators.url(url):
             flash('please enter a valid url (e,g - https://example.com)','error')
             return redirect('/')
-        # ✅ SAFE TITLE FETCHING
-        title_text = "No title"  # Default value
-        try:
-            headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(url, timeout=5, headers=headers)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            title = soup.find('title')
-            title_text = title.text.strip() if title else "No title found"
-        except Exception as e:
-            title_text = f"Error: {str(e)}"
-        
-        print(f"🎯 DEBUG: Title: {title_text}")
-        
-        default_user = User.query.filter_by(email='default@example.com').first()
         
+        # Duplicate check - url_hash unique index pe ek probe
+        hashed = url_hash(url)
+        if db.session.query(URL.id).filter_by(url_hash=hashed).first():
+            flash('this URL is already saved', 'error')
+            return redirect('/')
+
+        # init_db() default user seed karta hai - na mile to bhi URL save ho (bulk_import jaisa)
+        default_user_id = db.session.query(User.id).filter_by(email=DEFAULT_USER_EMAIL).scalar()
         
-        new_url = URL(url=url, title=title_text, user_id=default_user.id)
+        # Title baad me aayega - abhi 'pending' ke saath save karo
+        new_url = URL(url=url, url_hash=hashed, title=None, title_status='pending',
+                      title_claimed_at=_utcnow(), user_id=default_user_id)
         db.session.add(new_url)
-        db.session.commit()  # 👈 FLUSH KI JAGAH COMMIT KARO
+        db.session.flush()  # 👈 sirf id chahiye - commit neeche ek hi baar
 
-        print(f"🎯 DEBUG: URL ID: {new_url.id}")
+        # Tags: registry se ids, saare links ek bulk insert me
+        tag_ids = tag_registry.ids()
+        links = [{'url_id': new_url.id, 'tag_id': tag_ids[name]}
+                 for name in dict.fromkeys(tags) if name in tag_ids]
+        if links:
+            db.session.execute(db.insert(URLTag), links)
 
-        # Add tags
-        for tag_name in tags:
-            tag = Tag.query.filter_by(name=tag_name).first()
-            print(f"🎯 DEBUG: Tag '{tag_name}' found: {tag is not None}")
-    
-            if tag:
-                url_tag = URLTag(url_id=new_url.id, tag_id=tag.id)
-                db.session.add(url_tag)
-                db.session.commit()  # 👈 YE RAHEGA TAGS KE LIYE
+        db.session.commit()  # 👈 URL + tags ek hi transaction me
+        log.debug('add_url url_id=%s tags_linked=%d', new_url.id, len(links))
+
+        # Remote site ka wait nahi - worker pool title fill karega
+        get_title_worker().submit(new_url.id, url)
         
+    except IntegrityError:
+        # Check aur insert ke beech kisi aur request ne same URL add kar diya
+        db.session.rollback()
+        flash('this URL is already saved', 'error')
     except Exception as e:
         db.session.rollback()
-        print(f"❌ Error adding URL: {e}")
+        log.exception('add_url failed error=%s', e)
     
     return redirect('/')
 
-@app.route('/delete/<int:url_id>', methods=['POST'])
+# ✅ BULK IMPORT - JSON / JSONL / browser bookmarks HTML upload (bulk_import.py)
+@bp.route('/import', methods=['POST'])
+@response_cache.invalidates
+def import_urls():
+    upload = request.files.get('file')
+    if not upload or not upload.filename:
+        flash('please choose a file to import', 'error')
+        return redirect('/')
+
+    try:
+        fetch_titles = request.form.get('fetch_titles') == 'on'
+        stats = import_file(upload.stream, detect_format(upload.filename),
+                            on_pending=get_title_worker().submit if fetch_titles else None)
+        flash(f"Imported {stats['imported']} URLs "
+              f"({stats['duplicates']} duplicates, {stats['skipped']} skipped)", 'success')
+        log.info('import finished file=%s %s', upload.filename,
+                 ' '.join(f'{key}={value}' for key, value in stats.items()))
+    except Exception as e:
+        log.exception('import failed file=%s error=%s', upload.filename, e)
+        flash(f'Import failed: {e}', 'error')
+
+    return redirect('/')
+
+# ✅ STREAMING EXPORT - poora collection chunks me (bulk_export.py), memory constant
+# /export?format=json|jsonl|csv|html&section=all|active|archived&tag=<name>
+@bp.route('/export')
+def export_urls():
+    fmt = request.args.get('format', 'json')
+    section = request.args.get('section', 'all')
+    tag = request.args.get('tag', '').strip() or None
+    try:
+        chunks = bulk_export.export(fmt, section, tag)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    filename = bulk_export.export_filename(fmt, section, tag)
+    return Response(stream_with_context(chunks), mimetype=bulk_export.MIMETYPES[fmt],
+                    headers={'Content-Disposition': f'attachment; filename="{filename}"'})
+
+# ✅ LINK HEALTH CHECK - link_checker.py ka ek run background thread me
+# (cron se `python link_checker.py` bhi chala sakte ho). Ek waqt pe ek hi run.
+link_check_lock = threading.Lock()
+
+def run_link_check(app):
+    try:
+        from link_checker import check_links   # requests sirf link check pe load
+        with app.app_context():
+            stats = check_links(on_commit=response_cache.bump)
+        log.info('link check finished %s', ' '.join(f'{key}={value}' for key, value in stats.items()))
+    except Exception as e:
+        log.exception('link check failed error=%s', e)
+    finally:
+        link_check_lock.release()
+
+@bp.route('/check-links', methods=['POST'])
+def start_link_check():
+    if link_check_lock.acquire(blocking=False):
+        threading.Thread(target=run_link_check, args=(current_app._get_current_object(),),
+                         name='link-check-run', daemon=True).start()
+        flash('Link check started - broken links will be marked as results come in', 'success')
+    else:
+        flash('A link check is already running', 'error')
+    return redirect('/')
+
+@bp.route('/delete/<int:url_id>', methods=['POST'])
+@response_cache.invalidates
 def delete_url(url_id):
     try:
         # 1. Pehle URLTags delete karo (foreign key constraint)
@@ -242,57 +732,62 @@ def delete_url(url_id):
         if url:
             db.session.delete(url)
             db.session.commit()
-            print(f"✅ URL {url_id} deleted successfully")
+            log.info('url deleted url_id=%s', url_id)
         else:
-            print(f"❌ URL {url_id} not found")
+            log.warning('delete_url not found url_id=%s', url_id)
             
     except Exception as e:
         db.session.rollback()
-        print(f"❌ Error deleting URL {url_id}: {e}")
+        log.exception('delete_url failed url_id=%s error=%s', url_id, e)
     
     return redirect('/')
 
-@app.route('/archive/<int:url_id>', methods=['POST'])
+@bp.route('/archive/<int:url_id>', methods=['POST'])
+@response_cache.invalidates
 def archive_url(url_id):
     url = URL.query.get(url_id)
     if url:
         url.is_archived = True
         db.session.commit()
-        print(f"✅ URL {url_id} archived")
+        log.info('url archived url_id=%s', url_id)
     return redirect('/')
 
-@app.route('/unarchive/<int:url_id>', methods=['POST'])
+@bp.route('/unarchive/<int:url_id>', methods=['POST'])
+@response_cache.invalidates
 def unarchive_url(url_id):
     url = URL.query.get(url_id)  
     if url:
         url.is_archived = False
         db.session.commit()
-        print(f"✅ URL {url_id} unarchived")
+        log.info('url unarchived url_id=%s', url_id)
     return redirect('/')
 
-@app.route('/remove-tag/<int:url_id>/<tag>')
+@bp.route('/remove-tag/<int:url_id>/<tag>')
+@response_cache.invalidates
 def remove_tag(url_id, tag):
     try:
-        # Find the tag
-        tag_obj = Tag.query.filter_by(name=tag).first()
+        # Tag registry se - name -> id ke liye query nahi
+        tag_obj = tag_registry.get(tag)
         if tag_obj:
-            # Remove the relationship
-            url_tag = URLTag.query.filter_by(url_id=url_id, tag_id=tag_obj.id).first()
-            if url_tag:
-                db.session.delete(url_tag)
-                db.session.commit()
-                print(f"✅ Tag '{tag}' removed from URL {url_id}")
+            # Remove the relationship - seedha DELETE, pehle SELECT nahi
+            removed = URLTag.query.filter_by(url_id=url_id, tag_id=tag_obj.id).delete()
+            db.session.commit()
+            if removed:
+                log.info('tag removed url_id=%s tag=%s', url_id, tag)
             else:
-                print(f"❌ Tag relationship not found")
+                log.warning('remove_tag link not found url_id=%s tag=%s', url_id, tag)
         else:
-            print(f"❌ Tag '{tag}' not found")
+            log.warning('remove_tag unknown tag=%s', tag)
             
     except Exception as e:
         db.session.rollback()
-        print(f"❌ Error removing tag: {e}")
+        log.exception('remove_tag failed url_id=%s tag=%s error=%s', url_id, tag, e)
     
     return redirect('/')
 
 if __name__ == '__main__':
     port = int(os.environ.get("PORT", 5000))
+    app = create_app()
+    with app.app_context():
+        requeue_pending_titles()
     app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
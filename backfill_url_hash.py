@@ -0,0 +1,79 @@
+import sys
+import argparse
+
+from models import db, URL
+from urlnorm import url_hash
+
+
+# ✅ url.url_hash BACKFILL - migration 4 ke baad purane rows ke liye
+# id order me batches me chalta hai (har batch ek transaction), beech me rok ke
+# dobara chalao to wahi se continue karega. Agar do purane rows normalize hoke
+# same URL nikle, to pehle wale ko hash milta hai aur baaki NULL rehte hain
+# (unique index ke liye) - unki ids report me print hoti hain.
+BATCH_SIZE = 1000
+
+
+def backfill(batch_size=BATCH_SIZE):
+    stats = {'hashed': 0, 'duplicates': 0, 'invalid': 0}
+    duplicate_ids = []
+    last_id = 0
+
+    while True:
+        rows = (db.session.query(URL.id, URL.url)
+                .filter(URL.url_hash.is_(None), URL.id > last_id)
+                .order_by(URL.id).limit(batch_size).all())
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        hashes = {}
+        for row in rows:
+            try:
+                hashed = url_hash(row.url or '')
+            except ValueError:
+                stats['invalid'] += 1
+                continue
+            if hashed in hashes:
+                duplicate_ids.append(row.id)
+            else:
+                hashes[hashed] = row.id
+
+        # Jo hash DB me pehle se kisi row pe hai woh bhi duplicate hai
+        taken = {row[0] for row in
+                 db.session.query(URL.url_hash).filter(URL.url_hash.in_(list(hashes)))}
+        updates = []
+        for hashed, url_id in hashes.items():
+            if hashed in taken:
+                duplicate_ids.append(url_id)
+            else:
+                updates.append({'id': url_id, 'url_hash': hashed})
+
+        if updates:
+            db.session.execute(db.update(URL), updates)  # executemany UPDATE by primary key
+        db.session.commit()
+        stats['hashed'] += len(updates)
+        print(f"✅ Batch up to id {last_id}: {len(updates)} hashed")
+
+    stats['duplicates'] = len(duplicate_ids)
+    return stats, duplicate_ids
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Backfill url.url_hash for existing rows')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    from app import app
+
+    with app.app_context():
+        stats, duplicate_ids = backfill(args.batch_size)
+
+    for key, value in stats.items():
+        print(f"📊 {key}: {value}")
+    if duplicate_ids:
+        print(f"⚠️ Duplicate URL ids left without hash: {duplicate_ids[:50]}"
+              f"{' ...' if len(duplicate_ids) > 50 else ''}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.generate_data import WORDS, generate_records
+from benchmarks.run_load import percentile
+
+
+# ✅ FUZZY SEARCH BENCHMARK
+# Temporary SQLite database me N synthetic URLs, phir fuzzy index ka build time,
+# memory aur typo wali queries ka p50/p95 latency.
+#   python benchmarks/bench_fuzzy_search.py --urls 100000
+def typo(word, rng):
+    # Ek random edit: delete / swap / replace
+    i = rng.randrange(len(word))
+    kind = rng.choice(('delete', 'swap', 'replace'))
+    if kind == 'delete':
+        return word[:i] + word[i + 1:]
+    if kind == 'swap' and i < len(word) - 1:
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word[:i] + rng.choice('abcdefghijklmnopqrstuvwxyz') + word[i + 1:]
+
+
+def make_queries(count, rng):
+    queries = []
+    for _ in range(count):
+        words = rng.sample(WORDS, rng.choice((1, 1, 2, 3)))
+        queries.append(' '.join(typo(word, rng) if rng.random() < 0.5 else word for word in words))
+    return queries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the in-process fuzzy search index')
+    parser.add_argument('--urls', type=int, default=100_000)
+    parser.add_argument('--queries', type=int, default=500)
+    parser.add_argument('--limit', type=int, default=20, help='top-k per query')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    tmpdir = tempfile.TemporaryDirectory(prefix='url-manager-fuzzy-')
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tmpdir.name, 'fuzzy.db')}"
+
+    from app import app, init_db
+    from bulk_import import import_records
+    from fuzzy_index import fuzzy_index
+
+    try:
+        with app.app_context():
+            init_db()
+            import_records(generate_records(args.urls, 500, 0.2, 1.5, [], 365, args.seed),
+                           batch_size=5000)
+
+            started = time.perf_counter()
+            fuzzy_index.sync()
+            build_seconds = time.perf_counter() - started
+
+            # Memory alag build me - tracemalloc build ko kaafi slow kar deta hai
+            fuzzy_index.invalidate()
+            tracemalloc.start()
+            fuzzy_index.sync()
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            rng = random.Random(args.seed)
+            timings = []
+            hits = 0
+            for query in make_queries(args.queries, rng):
+                started = time.perf_counter()
+                results = fuzzy_index.search(query, args.limit)
+                timings.append((time.perf_counter() - started) * 1000)
+                hits += bool(results)
+    finally:
+        tmpdir.cleanup()
+
+    timings.sort()
+    print(f"🏗️ Build: {build_seconds:.2f}s, {memory / 2**20:.1f} MiB, {fuzzy_index.stats()}")
+    print(f"🔍 {len(timings)} queries (top {args.limit}): p50 {percentile(timings, 50):.2f} ms, "
+          f"p95 {percentile(timings, 95):.2f} ms, p99 {percentile(timings, 99):.2f} ms, "
+          f"{hits / len(timings):.0%} with results")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
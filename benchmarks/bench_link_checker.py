@@ -0,0 +1,75 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import start_stub_server
+
+
+# ✅ LINK CHECKER BENCHMARK
+# Temporary SQLite database me N links (stub server pe, 127.0.0.x loopback "hosts" me
+# bante hue) daal ke link_checker ka ek poora run aur phir ek conditional (ETag) rerun.
+# Kuch links 404 / 500 / band port pe hain - broken count bhi check hota hai.
+#   python benchmarks/bench_link_checker.py --urls 20000 --hosts 50 --latency 0.05
+def make_records(count, hosts, port, latency, broken_ratio, seed):
+    rng = random.Random(seed)
+    for i in range(count):
+        host = f'127.0.0.{1 + i % hosts}'
+        status = 200
+        if rng.random() < broken_ratio:
+            status = rng.choice([404, 410, 500])
+        yield {
+            'url': f'http://{host}:{port}/page/{i}?latency={latency}&status={status}'
+                   f'&size=50000&etag=v{i}&title=Page+{i}',
+            'title': f'Old title {i}',
+            'tags': [],
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the link checker against a local stub server')
+    parser.add_argument('--urls', type=int, default=5000)
+    parser.add_argument('--hosts', type=int, default=50, help='distinct loopback hosts')
+    parser.add_argument('--latency', type=float, default=0.05, help='stub response latency (s)')
+    parser.add_argument('--broken-ratio', type=float, default=0.05)
+    parser.add_argument('--workers', type=int, default=32)
+    parser.add_argument('--per-host', type=int, default=2)
+    parser.add_argument('--host-delay', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    tmpdir = tempfile.TemporaryDirectory(prefix='url-manager-links-')
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tmpdir.name, 'links.db')}"
+    stub, _ = start_stub_server(host='0.0.0.0')     # 127.0.0.x sab pe sunta hai
+    port = stub.server_address[1]
+
+    from app import app, init_db
+    from bulk_import import import_records
+    from link_checker import LinkChecker, check_links
+
+    try:
+        with app.app_context():
+            init_db()
+            import_records(make_records(args.urls, args.hosts, port, args.latency,
+                                        args.broken_ratio, args.seed))
+            checker = LinkChecker(args.workers, args.per_host, args.host_delay)
+
+            for label in ('first run', 'conditional rerun'):
+                started = time.perf_counter()
+                stats = check_links(max_age=timedelta(0), checker=checker)
+                seconds = time.perf_counter() - started
+                print(f"🔗 {label}: {stats['checked']} links in {seconds:.2f}s "
+                      f"({stats['checked'] / seconds:.0f}/s) - "
+                      + ', '.join(f'{key}={value}' for key, value in stats.items()))
+    finally:
+        stub.shutdown()
+        tmpdir.cleanup()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,125 @@
+import os
+import sys
+import json
+import time
+import tarfile
+import argparse
+import tempfile
+import subprocess
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.run_load import percentile, git_commit
+
+
+# ✅ WORKER COLD-START BENCHMARK
+# Har run ek naya Python process hai (jaise naya gunicorn worker): `import app` ka time,
+# pehli request (GET /) ka time, max RSS memory aur kaun se heavy modules load hue.
+# --rev se purane commit ka tree (git archive) bhi measure hota hai - before / after.
+#   python benchmarks/bench_startup.py --rev HEAD~1 --runs 10
+HEAVY_MODULES = ('requests', 'urllib3', 'bs4', 'validators', 'rapidfuzz', 'cachetools')
+
+PREPARE = """
+import app as module
+with module.app.app_context():
+    (getattr(module, 'init_db', None) or module.initialize)()
+"""
+
+MEASURE = """
+import sys, json, time, resource
+started = time.perf_counter()
+import app as module
+flask_app = module.app      # create_app() - config, engine, DB init
+imported = time.perf_counter()
+status = flask_app.test_client().get('/').status_code
+served = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - started) * 1000,
+    'first_request_ms': (served - imported) * 1000,
+    'status': status,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'modules': len(sys.modules),
+    'heavy_modules': [name for name in %r if name in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def export_rev(rev, dest):
+    # Commit ka tree temp folder me (working copy chhede bina)
+    archive = subprocess.run(['git', 'archive', '--format=tar', rev], cwd=ROOT,
+                             check=True, capture_output=True).stdout
+    with tempfile.TemporaryFile() as f:
+        f.write(archive)
+        f.seek(0)
+        with tarfile.open(fileobj=f) as tar:
+            tar.extractall(dest)
+
+
+def run_python(code, cwd, env):
+    return subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env, check=True,
+                          capture_output=True, text=True).stdout
+
+
+def measure(label, tree, runs, workdir):
+    db_path = os.path.join(workdir, f'{label}.db')
+    env = dict(os.environ, DATABASE_URL=f'sqlite:///{db_path}', LOG_LEVEL='WARNING')
+    run_python(PREPARE, tree, env)     # schema + tags pehle se - sirf worker boot measure ho
+
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        output = run_python(MEASURE, tree, env)
+        sample = json.loads(output.strip().splitlines()[-1])
+        sample['process_ms'] = (time.perf_counter() - started) * 1000
+        samples.append(sample)
+
+    summary = {'runs': runs, 'status': samples[-1]['status'],
+               'heavy_modules': samples[-1]['heavy_modules'], 'modules': samples[-1]['modules']}
+    for key in ('process_ms', 'import_ms', 'first_request_ms', 'max_rss_mb'):
+        values = sorted(sample[key] for sample in samples)
+        summary[key] = {'p50': round(percentile(values, 50), 2), 'max': round(values[-1], 2)}
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure worker cold-start time and memory')
+    parser.add_argument('--rev', action='append', default=[],
+                        help='also measure this git revision (repeatable), e.g. HEAD~1')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--output', help='result JSON path (default: benchmarks/results/startup-<commit>.json)')
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='url-manager-startup-') as workdir:
+        for rev in args.rev:
+            tree = os.path.join(workdir, 'tree-' + rev.replace('/', '_').replace('~', '_'))
+            export_rev(rev, tree)
+            print(f"⏱️ Measuring {rev} ...")
+            results[rev] = measure(f'rev-{len(results)}', tree, args.runs, workdir)
+        print("⏱️ Measuring working tree ...")
+        results['working tree'] = measure('working', ROOT, args.runs, workdir)
+
+    print(f"\n{'target':>14} {'process ms':>11} {'import ms':>10} {'1st req ms':>11} "
+          f"{'max RSS MB':>11} {'modules':>8}  heavy modules loaded")
+    for label, row in results.items():
+        print(f"{label:>14} {row['process_ms']['p50']:>11.1f} {row['import_ms']['p50']:>10.1f} "
+              f"{row['first_request_ms']['p50']:>11.1f} {row['max_rss_mb']['p50']:>11.1f} "
+              f"{row['modules']:>8}  {', '.join(row['heavy_modules']) or '-'}")
+
+    commit = git_commit()
+    output = args.output or os.path.join(ROOT, 'benchmarks', 'results', f'startup-{commit}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'benchmark': 'startup',
+            'commit': commit,
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'results': results,
+        }, f, indent=2)
+    print(f"\n💾 Results saved to {output}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
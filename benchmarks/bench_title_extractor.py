@@ -0,0 +1,86 @@
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+
+import requests
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import title_extractor
+from benchmarks.stub_server import start_stub_server
+
+
+# ✅ TITLE EXTRACTION BENCHMARK
+# Purana tarika (poora body download + BeautifulSoup full parse + naya connection)
+# vs streaming <head>-only extractor (pooled session) vs cache hit
+def legacy_fetch_title(url):
+    headers = {'User-Agent': 'Mozilla/5.0'}
+    response = requests.get(url, timeout=30, headers=headers)
+    soup = BeautifulSoup(response.content, 'html.parser')
+    title = soup.find('title')
+    return title.text.strip() if title else "No title found"
+
+
+def streaming_fetch_title(url):
+    return title_extractor.fetch_title(url, use_cache=False)
+
+
+def cached_fetch_title(url):
+    return title_extractor.fetch_title(url)
+
+
+def measure(fetch, url, iterations):
+    timings = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        title = fetch(f'{url}&i={i}' if fetch is not cached_fetch_title else url)
+        timings.append((time.perf_counter() - start) * 1000)
+    return title, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark title extraction strategies')
+    parser.add_argument('--sizes', default='50000,2000000,20000000',
+                        help='comma separated page sizes in bytes')
+    parser.add_argument('--iterations', type=int, default=5)
+    parser.add_argument('--output', help='write results as JSON to this file')
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server()
+    strategies = [('legacy', legacy_fetch_title),
+                  ('streaming', streaming_fetch_title),
+                  ('cached', cached_fetch_title)]
+    results = []
+
+    print(f"{'page size':>12} {'strategy':>10} {'median ms':>10} {'max ms':>10}  title")
+    for size in [int(s) for s in args.sizes.split(',')]:
+        url = f'{base_url}/page?size={size}&title=Big+Page+{size}'
+        title_extractor.clear_cache()
+        title_extractor.fetch_title(url)    # cache warm karo 'cached' strategy ke liye
+
+        for name, fetch in strategies:
+            title, timings = measure(fetch, url, args.iterations)
+            row = {
+                'size': size,
+                'strategy': name,
+                'median_ms': round(statistics.median(timings), 3),
+                'max_ms': round(max(timings), 3),
+                'title': title,
+            }
+            results.append(row)
+            print(f"{size:>12} {name:>10} {row['median_ms']:>10.2f} {row['max_ms']:>10.2f}  {title}")
+
+    server.shutdown()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'benchmark': 'title_extractor', 'results': results}, f, indent=2)
+        print(f"💾 Results saved to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
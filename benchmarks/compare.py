@@ -0,0 +1,58 @@
+import sys
+import json
+import argparse
+
+
+# ✅ COMPARE TWO LOAD RESULTS
+#   python benchmarks/compare.py benchmarks/results/load-abc123.json benchmarks/results/load-def456.json
+# Kisi route ka p95 --threshold se zyada badha to exit code 1 (CI me regression pakadne ke liye)
+METRICS = ('p50_ms', 'p95_ms', 'p99_ms', 'throughput_rps')
+
+
+def change(old, new):
+    if not old:
+        return None
+    return (new - old) / old
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare two run_load.py result files')
+    parser.add_argument('baseline')
+    parser.add_argument('candidate')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed relative p95 increase per route (default 0.2 = 20%%)')
+    args = parser.parse_args(argv)
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.candidate, encoding='utf-8') as f:
+        candidate = json.load(f)
+
+    print(f"baseline {baseline.get('commit')}  ->  candidate {candidate.get('commit')}\n")
+    print(f"{'route':>12} " + ' '.join(f'{metric:>24}' for metric in METRICS))
+
+    regressions = []
+    routes = sorted(set(baseline['routes']) & set(candidate['routes']))
+    for name in routes + ['TOTAL']:
+        old = baseline['total'] if name == 'TOTAL' else baseline['routes'][name]
+        new = candidate['total'] if name == 'TOTAL' else candidate['routes'][name]
+        cells = []
+        for metric in METRICS:
+            delta = change(old[metric], new[metric])
+            delta_text = f'{delta:+.0%}' if delta is not None else 'n/a'
+            cells.append(f"{old[metric]:>9.1f} -> {new[metric]:>8.1f} {delta_text:>5}")
+        print(f"{name:>12} " + ' '.join(f'{cell:>24}' for cell in cells))
+
+        p95_delta = change(old['p95_ms'], new['p95_ms'])
+        if name != 'TOTAL' and p95_delta is not None and p95_delta > args.threshold:
+            regressions.append((name, p95_delta))
+
+    if regressions:
+        print('\n⚠️ p95 regressions: ' + ', '.join(f'{name} {delta:+.0%}' for name, delta in regressions))
+        return 1
+    print('\n✅ No p95 regressions above threshold')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import os
+import sys
+import random
+import argparse
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# ✅ SYNTHETIC DATA GENERATOR
+# DATABASE_URL wale database (SQLite ya local Postgres) me N URLs, tags aur links bharta hai.
+# Insert bulk_import pipeline se hota hai (batched, FTS index bhi sync rehta hai).
+#   DATABASE_URL=sqlite:////tmp/bench.db python benchmarks/generate_data.py --urls 100000
+WORDS = ('python flask postgres sqlite search index cache worker async http api json '
+         'design rust linux kernel network database tutorial guide release notes news '
+         'research paper review video music recipe travel finance startup security').split()
+
+
+def generate_records(count, hosts, archived_ratio, tags_per_url, tag_names, days, seed):
+    rng = random.Random(seed)
+    now = datetime.utcnow().replace(microsecond=0)
+    host_names = [f'site{i}.example.com' for i in range(hosts)]
+    for i in range(count):
+        words = rng.sample(WORDS, 4)
+        # tags_per_url average hai - har URL ko 0..2x tags
+        tag_count = min(len(tag_names), int(rng.random() * 2 * tags_per_url + 0.5))
+        yield {
+            'url': f'https://{rng.choice(host_names)}/{"-".join(words[:2])}/{i}',
+            'title': ' '.join(word.capitalize() for word in words) + f' #{i}',
+            'tags': rng.sample(tag_names, tag_count),
+            'is_archived': rng.random() < archived_ratio,
+            'created_at': now - timedelta(seconds=rng.randrange(days * 86400)),
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Fill the database with synthetic bookmarks')
+    parser.add_argument('--urls', type=int, default=10_000)
+    parser.add_argument('--hosts', type=int, default=500, help='distinct hostnames')
+    parser.add_argument('--archived-ratio', type=float, default=0.2)
+    parser.add_argument('--tags-per-url', type=float, default=1.5, help='average tags per URL')
+    parser.add_argument('--days', type=int, default=365, help='spread created_at over N days')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    from app import app, init_db
+    from bulk_import import import_records
+    from tag_registry import tag_registry
+
+    with app.app_context():
+        init_db()   # tables, migrations, search index, default tags + user (idempotent)
+        tag_names = sorted(tag_registry.ids())
+        records = generate_records(args.urls, args.hosts, args.archived_ratio,
+                                   args.tags_per_url, tag_names, args.days, args.seed)
+        started = datetime.now()
+        stats = import_records(records, batch_size=args.batch_size)
+
+    seconds = (datetime.now() - started).total_seconds()
+    print(f"🎉 Generated {stats['imported']} URLs in {seconds:.2f}s "
+          f"({stats['duplicates']} duplicates skipped)")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
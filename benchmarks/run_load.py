@@ -0,0 +1,275 @@
+import os
+import sys
+import json
+import time
+import random
+import socket
+import argparse
+import tempfile
+import threading
+import subprocess
+from datetime import datetime, timezone
+from collections import defaultdict
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.stub_server import start_stub_server
+from benchmarks.generate_data import WORDS
+
+
+# ✅ LOAD / LATENCY DRIVER
+# App ko gunicorn ke neeche chalata hai (ya --url wale running server pe), realistic
+# request mix replay karta hai aur har route ka p50/p95/p99 latency + throughput
+# JSON file me save karta hai. Do commits ke results benchmarks/compare.py se compare karo.
+#
+#   python benchmarks/run_load.py --urls 20000 --duration 30 --concurrency 8
+DEFAULT_MIX = 'index=40,search=20,api=15,add=10,archive=10,remove_tag=5'
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(','):
+        name, weight = part.split('=')
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+class Workload:
+    def __init__(self, base_url, stub_url, stub_latency, stub_size, seed):
+        self.base_url = base_url
+        self.stub_url = stub_url
+        self.stub_latency = stub_latency
+        self.stub_size = stub_size
+        self.rng = random.Random(seed)
+        self.counter = 0
+        self.lock = threading.Lock()
+        self.url_ids = []
+
+    def load_ids(self):
+        response = requests.get(f'{self.base_url}/api/urls', params={'limit': 200}, timeout=30)
+        self.url_ids = [item['id'] for item in response.json()['urls']]
+
+    def _next(self):
+        with self.lock:
+            self.counter += 1
+            return self.counter
+
+    # Har operation -> (method, path, data)
+    def index(self):
+        return 'GET', '/', None
+
+    def search(self):
+        return 'GET', f'/search?q={self.rng.choice(WORDS)}', None
+
+    def api(self):
+        section = 'archived' if self.rng.random() < 0.2 else 'active'
+        return 'GET', f'/api/urls?section={section}', None
+
+    def add(self):
+        n = self._next()
+        target = (f'{self.stub_url}/bench/{os.getpid()}/{time.time_ns()}/{n}'
+                  f'?latency={self.stub_latency}&size={self.stub_size}&title=Bench+{n}')
+        return 'POST', '/add', {'url': target, 'tags': self.rng.choice(['work', 'news', ''])}
+
+    def archive(self):
+        url_id = self.rng.choice(self.url_ids) if self.url_ids else 1
+        action = 'archive' if self.rng.random() < 0.5 else 'unarchive'
+        return 'POST', f'/{action}/{url_id}', None
+
+    def remove_tag(self):
+        url_id = self.rng.choice(self.url_ids) if self.url_ids else 1
+        return 'GET', f'/remove-tag/{url_id}/{self.rng.choice(["work", "news"])}', None
+
+
+def run_clients(workload, mix, concurrency, duration, warmup):
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    samples = defaultdict(list)
+    errors = defaultdict(int)
+    samples_lock = threading.Lock()
+    measure_from = time.perf_counter() + warmup
+    deadline = measure_from + duration
+
+    def client(seed):
+        rng = random.Random(seed)
+        session = requests.Session()
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                return
+            name = rng.choices(names, weights)[0]
+            method, path, data = getattr(workload, name)()
+            start = time.perf_counter()
+            try:
+                response = session.request(method, workload.base_url + path, data=data,
+                                            allow_redirects=False, timeout=60)
+                ok = response.status_code < 400
+            except requests.RequestException:
+                ok = False
+            elapsed = (time.perf_counter() - start) * 1000
+            if start < measure_from:
+                continue    # warmup - record mat karo
+            with samples_lock:
+                samples[name].append(elapsed)
+                if not ok:
+                    errors[name] += 1
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples, errors
+
+
+def summarize(samples, errors, duration):
+    routes = {}
+    all_values = []
+    for name, values in sorted(samples.items()):
+        values.sort()
+        all_values.extend(values)
+        routes[name] = {
+            'count': len(values),
+            'errors': errors.get(name, 0),
+            'throughput_rps': round(len(values) / duration, 2),
+            'mean_ms': round(sum(values) / len(values), 3),
+            'p50_ms': round(percentile(values, 50), 3),
+            'p95_ms': round(percentile(values, 95), 3),
+            'p99_ms': round(percentile(values, 99), 3),
+        }
+    all_values.sort()
+    total = {
+        'count': len(all_values),
+        'errors': sum(errors.values()),
+        'throughput_rps': round(len(all_values) / duration, 2),
+        'p50_ms': round(percentile(all_values, 50) or 0, 3),
+        'p95_ms': round(percentile(all_values, 95) or 0, 3),
+        'p99_ms': round(percentile(all_values, 99) or 0, 3),
+    }
+    return routes, total
+
+
+def start_gunicorn(database_url, workers, threads, env_overrides):
+    port = free_port()
+    env = dict(os.environ, DATABASE_URL=database_url, **env_overrides)
+    if workers > 1:
+        env.setdefault('RESPONSE_CACHE_BACKEND', 'database')  # workers ke beech coherent cache
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--workers', str(workers), '--threads', str(threads),
+         '--bind', f'127.0.0.1:{port}', '--log-level', 'warning', 'app:app'],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL)
+    base_url = f'http://127.0.0.1:{port}'
+
+    for _ in range(300):
+        if process.poll() is not None:
+            raise RuntimeError('gunicorn exited during startup')
+        try:
+            if requests.get(base_url + '/', timeout=2).status_code == 200:
+                return process, base_url
+        except requests.RequestException:
+            pass
+        time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError('gunicorn did not become ready in 30s')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Replay a request mix against the app under gunicorn')
+    parser.add_argument('--url', help='benchmark an already running server instead of starting gunicorn')
+    parser.add_argument('--database-url', help='default: fresh temporary SQLite database')
+    parser.add_argument('--urls', type=int, default=10_000, help='synthetic URLs to generate first (0 = skip)')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--threads', type=int, default=1, help='gunicorn threads per worker')
+    parser.add_argument('--concurrency', type=int, default=8, help='concurrent clients')
+    parser.add_argument('--duration', type=float, default=20, help='measured seconds')
+    parser.add_argument('--warmup', type=float, default=3, help='unmeasured seconds before measuring')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'route=weight list (default: {DEFAULT_MIX})')
+    parser.add_argument('--stub-latency', type=float, default=0.3, help='remote site latency for /add (s)')
+    parser.add_argument('--stub-size', type=int, default=200_000, help='remote page size for /add (bytes)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='result JSON path (default: benchmarks/results/load-<commit>.json)')
+    args = parser.parse_args(argv)
+
+    mix = parse_mix(args.mix)
+    stub, stub_url = start_stub_server()
+    process = None
+    tmpdir = None
+
+    try:
+        if args.url:
+            base_url = args.url.rstrip('/')
+        else:
+            database_url = args.database_url
+            if not database_url:
+                tmpdir = tempfile.TemporaryDirectory(prefix='url-manager-bench-')
+                database_url = f"sqlite:///{os.path.join(tmpdir.name, 'bench.db')}"
+            if args.urls:
+                print(f"🧪 Generating {args.urls} URLs ...")
+                subprocess.run([sys.executable, os.path.join(ROOT, 'benchmarks', 'generate_data.py'),
+                                '--urls', str(args.urls)],
+                               cwd=ROOT, env=dict(os.environ, DATABASE_URL=database_url),
+                               check=True, stdout=subprocess.DEVNULL)
+            process, base_url = start_gunicorn(database_url, args.workers, args.threads, {})
+
+        workload = Workload(base_url, stub_url, args.stub_latency, args.stub_size, args.seed)
+        workload.load_ids()
+
+        print(f"🚀 {args.concurrency} clients x {args.duration}s against {base_url} ...")
+        samples, errors = run_clients(workload, mix, args.concurrency, args.duration, args.warmup)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+        stub.shutdown()
+        if tmpdir is not None:
+            tmpdir.cleanup()
+
+    routes, total = summarize(samples, errors, args.duration)
+    commit = git_commit()
+    result = {
+        'benchmark': 'load',
+        'commit': commit,
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'config': {key: value for key, value in vars(args).items() if key != 'output'},
+        'routes': routes,
+        'total': total,
+    }
+
+    print(f"\n{'route':>12} {'count':>7} {'err':>5} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, row in list(routes.items()) + [('TOTAL', total)]:
+        print(f"{name:>12} {row['count']:>7} {row['errors']:>5} {row['throughput_rps']:>8.1f} "
+              f"{row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f}")
+
+    output = args.output or os.path.join(ROOT, 'benchmarks', 'results', f'load-{commit}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2)
+    print(f"\n💾 Results saved to {output}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
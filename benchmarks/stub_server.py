@@ -0,0 +1,110 @@
+import sys
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+# ✅ STUB "REMOTE SITE" - benchmarks ke liye, internet ki zarurat nahi
+# Har request query params se configure hoti hai:
+#   /any/path?size=5000000&latency=0.2&status=200&title=Hello
+#   size    - total body bytes (title <head> me sabse pehle aata hai)
+#   latency - response se pehle kitne seconds ruke
+#   status  - HTTP status code
+#   title   - <title> ka text (default: path)
+#   etag    - ETag header; matching If-None-Match pe 304 (conditional recheck)
+FILLER = b'<p>' + b'lorem ipsum dolor sit amet ' * 40 + b'</p>\n'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'   # keep-alive, taaki pooled session ka fayda dikhe
+
+    def _params(self):
+        parsed = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        return {
+            'size': int(query.get('size', 20_000)),
+            'latency': float(query.get('latency', self.server.default_latency)),
+            'status': int(query.get('status', 200)),
+            'title': query.get('title', parsed.path),
+            'etag': query.get('etag'),
+        }
+
+    def _send(self, with_body):
+        params = self._params()
+        if params['latency']:
+            time.sleep(params['latency'])
+
+        if params['etag'] and params['status'] == 200:
+            etag = f'"{params["etag"]}"'
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+        head = (f"<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+                f"<title>{params['title']}</title></head><body>\n").encode()
+        size = max(params['size'], len(head))
+
+        self.send_response(params['status'])
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(size))
+        if params['etag']:
+            self.send_header('ETag', f'"{params["etag"]}"')
+        self.end_headers()
+        if not with_body:
+            return
+
+        try:
+            self.wfile.write(head)
+            remaining = size - len(head)
+            while remaining > 0:
+                chunk = FILLER[:remaining]
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            pass    # client ne title milte hi connection chhod diya - expected hai
+
+    def do_GET(self):
+        self._send(with_body=True)
+
+    def do_HEAD(self):
+        self._send(with_body=False)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Client ka beech me connection todna normal hai - traceback mat chhapo
+        if not isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            super().handle_error(request, client_address)
+
+
+def start_stub_server(host='127.0.0.1', port=0, latency=0.0):
+    server = StubServer((host, port), StubHandler)
+    server.default_latency = latency
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f'http://{host}:{server.server_address[1]}'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Stub web server for benchmarks')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8081)
+    parser.add_argument('--latency', type=float, default=0.0, help='default latency in seconds')
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(args.host, args.port, args.latency)
+    print(f"🚀 Stub server running at {base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
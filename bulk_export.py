@@ -0,0 +1,218 @@
+import io
+import sys
+import csv
+import json
+import html
+import argparse
+from datetime import datetime, timezone
+
+from models import db, URL, URLTag
+from tag_registry import tag_registry
+
+
+# ✅ STREAMING EXPORT
+# Poora collection generator ke through likho - rows server-side cursor se chunks me
+# (yield_per) padhe jaate hain aur har chunk ke tags ek hi IN query me aate hain.
+# Memory chunk size pe fixed hai - 1k bookmarks ho ya 1M.
+# Formats: urls.json ({"active": [...], "archived": [...]}), JSONL, CSV aur
+# Netscape bookmark HTML (browser me import ho jata hai, bulk_import bhi padh leta hai).
+CHUNK_SIZE = 1000
+
+SECTIONS = {
+    'all': (False, True),
+    'active': (False,),
+    'archived': (True,),
+}
+
+MIMETYPES = {
+    'json': 'application/json',
+    'jsonl': 'application/x-ndjson',
+    'csv': 'text/csv',
+    'html': 'text/html',
+}
+
+CSV_FIELDS = ['url', 'title', 'tags', 'is_archived', 'created_at']
+
+
+# ---------- Rows: har section ke records chunks me ----------
+
+def iter_chunks(is_archived, tag_id=None, chunk_size=CHUNK_SIZE):
+    # ORM objects nahi - sirf columns, taaki session identity map na bhare
+    query = (db.select(URL.id, URL.url, URL.title, URL.is_archived, URL.created_at)
+             .where(URL.is_archived == is_archived)
+             .order_by(URL.created_at, URL.id)     # ix_url_archived_created_id
+             .execution_options(yield_per=chunk_size))
+    if tag_id is not None:
+        query = query.where(db.exists().where(URLTag.url_id == URL.id, URLTag.tag_id == tag_id))
+
+    tag_names = {tag.id: tag.name for tag in tag_registry.all()}
+    for rows in db.session.execute(query).partitions():
+        # Is chunk ke saare tags ek query me - per-URL lazy load nahi
+        tags = {}
+        links = db.session.execute(
+            db.select(URLTag.url_id, URLTag.tag_id)
+            .where(URLTag.url_id.in_([row.id for row in rows]))
+            .order_by(URLTag.id))
+        for url_id, tag_id in links:
+            if tag_id in tag_names:
+                tags.setdefault(url_id, []).append(tag_names[tag_id])
+
+        yield [{
+            'url': row.url,
+            'title': row.title,
+            'tags': tags.get(row.id, []),
+            'is_archived': bool(row.is_archived),
+            'created_at': row.created_at,
+        } for row in rows]
+
+
+def _iso(value):
+    return value.isoformat(sep=' ') if value else None
+
+
+def _timestamp(value):
+    return int(value.replace(tzinfo=timezone.utc).timestamp()) if value else None
+
+
+# ---------- Writers: har ek text chunks yield karta hai ----------
+
+def write_json(sections, chunks):
+    yield '{'
+    for index, is_archived in enumerate((False, True)):
+        yield f'{", " if index else ""}"{"archived" if is_archived else "active"}": ['
+        first = True
+        if is_archived in sections:
+            for records in chunks(is_archived):
+                items = [json.dumps({'url': r['url'], 'title': r['title'], 'tags': r['tags'],
+                                     'created_at': _iso(r['created_at'])}, ensure_ascii=False)
+                         for r in records]
+                yield ('\n' if first else ',\n') + ',\n'.join(items)
+                first = False
+        yield '\n]' if not first else ']'
+    yield '}\n'
+
+
+def write_jsonl(sections, chunks):
+    for is_archived in sections:
+        for records in chunks(is_archived):
+            yield ''.join(json.dumps(dict(r, created_at=_iso(r['created_at'])),
+                                     ensure_ascii=False) + '\n' for r in records)
+
+
+def write_csv(sections, chunks):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(CSV_FIELDS)
+    for is_archived in sections:
+        for records in chunks(is_archived):
+            writer.writerows((r['url'], r['title'] or '', ','.join(r['tags']),
+                              int(r['is_archived']), _iso(r['created_at']) or '')
+                             for r in records)
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+    if buf.tell():
+        yield buf.getvalue()
+
+
+def _bookmark(record):
+    attrs = f' HREF="{html.escape(record["url"] or "")}"'
+    add_date = _timestamp(record['created_at'])
+    if add_date:
+        attrs += f' ADD_DATE="{add_date}"'
+    if record['tags']:
+        attrs += f' TAGS="{html.escape(",".join(record["tags"]))}"'
+    return f'    <DT><A{attrs}>{html.escape(record["title"] or record["url"] or "")}</A>\n'
+
+
+def write_html(sections, chunks):
+    yield ('<!DOCTYPE NETSCAPE-Bookmark-file-1>\n'
+           '<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">\n'
+           '<TITLE>Bookmarks</TITLE>\n<H1>Bookmarks</H1>\n<DL><p>\n')
+    for is_archived in sections:
+        if is_archived:
+            # Archived URLs alag folder me
+            yield '  <DT><H3>Archived</H3>\n  <DL><p>\n'
+        for records in chunks(is_archived):
+            yield ''.join(_bookmark(r) for r in records)
+        if is_archived:
+            yield '  </DL><p>\n'
+    yield '</DL><p>\n'
+
+
+WRITERS = {
+    'json': write_json,
+    'jsonl': write_jsonl,
+    'csv': write_csv,
+    'html': write_html,
+}
+
+
+def export(fmt='json', section='all', tag=None, chunk_size=CHUNK_SIZE):
+    # Text chunks ka generator - Flask Response ya file dono me likha ja sakta hai.
+    # Galat format / section / tag pe ValueError (generator shuru hone se pehle)
+    if fmt not in WRITERS:
+        raise ValueError(f"format must be one of {', '.join(sorted(WRITERS))}")
+    if section not in SECTIONS:
+        raise ValueError(f"section must be one of {', '.join(SECTIONS)}")
+    tag_id = None
+    if tag:
+        tag_info = tag_registry.get(tag)
+        if tag_info is None:
+            raise ValueError(f'unknown tag: {tag}')
+        tag_id = tag_info.id
+
+    def chunks(is_archived):
+        return iter_chunks(is_archived, tag_id, chunk_size)
+
+    return WRITERS[fmt](SECTIONS[section], chunks)
+
+
+def detect_format(filename):
+    name = (filename or '').lower()
+    if name.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    if name.endswith('.csv'):
+        return 'csv'
+    if name.endswith(('.html', '.htm')):
+        return 'html'
+    return 'json'
+
+
+def export_filename(fmt, section='all', tag=None):
+    parts = ['urls'] + ([section] if section != 'all' else []) + ([tag] if tag else [])
+    return f"{'-'.join(parts)}.{fmt}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export bookmarks from URL Manager')
+    parser.add_argument('path', nargs='?', help='output file (default: stdout)')
+    parser.add_argument('--format', choices=sorted(WRITERS), help='default: from file extension, else json')
+    parser.add_argument('--section', choices=list(SECTIONS), default='all')
+    parser.add_argument('--tag', help='only URLs with this tag')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    from app import app
+
+    fmt = args.format or detect_format(args.path)
+
+    started = datetime.now()
+    with app.app_context():
+        try:
+            chunks = export(fmt, args.section, args.tag, args.chunk_size)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.path:
+            with open(args.path, 'w', encoding='utf-8', newline='') as f:
+                f.writelines(chunks)
+        else:
+            sys.stdout.writelines(chunks)
+
+    if args.path:
+        seconds = (datetime.now() - started).total_seconds()
+        print(f"🎉 Exported to {args.path} in {seconds:.2f}s")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
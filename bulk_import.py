@@ -0,0 +1,389 @@
+import io
+import sys
+import json
+import argparse
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+from models import db, User, URL, URLTag
+from tag_registry import tag_registry
+from fuzzy_index import fuzzy_index
+from urlnorm import url_hash
+
+
+# ✅ BULK IMPORT PIPELINE
+# File ko stream karke parse karo (poora memory me load nahi), records ko batches me
+# executemany INSERT karo, aur jo URLs pehle se saved hain unhe skip karo.
+# Formats: urls.json ({"active": [...], "archived": [...]} ya plain list), JSONL,
+# aur browser ka Netscape bookmark HTML export.
+BATCH_SIZE = 1000
+READ_SIZE = 64 * 1024
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# ---------- Parsers: har ek generator {url, title, tags, is_archived, created_at} deta hai ----------
+
+def _created_at(value):
+    # bulk_export ISO timestamp likhta hai - round trip me original date bani rahe
+    if not isinstance(value, str):
+        return None
+    try:
+        created_at = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return created_at
+
+
+def _record(data, is_archived=False):
+    if not isinstance(data, dict):
+        return None
+    return {
+        'url': data.get('url'),
+        'title': data.get('title'),
+        'tags': data.get('tags') or [],
+        'is_archived': bool(data.get('is_archived', is_archived)),
+        'created_at': _created_at(data.get('created_at')),
+    }
+
+
+class _JSONStream:
+    # json.JSONDecoder.raw_decode ke upar chhota incremental reader -
+    # sirf utna text memory me rehta hai jitna current item ke liye chahiye
+    def __init__(self, f):
+        self.f = f
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        chunk = self.f.read(READ_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        if self.pos > READ_SIZE:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        self.buf += chunk
+        return True
+
+    def peek(self):
+        # Whitespace skip karke agla character (EOF pe '')
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, chars):
+        char = self.peek()
+        if char not in chars:
+            raise ValueError(f"Invalid JSON: expected one of {chars!r} but found {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+                # Buffer ke end pe khatam hua number adhoora ho sakta hai - aur padho
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def array_items(self):
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(',]') == ']':
+                return
+
+
+def iter_json(f):
+    stream = _JSONStream(f)
+    if stream.peek() == '[':
+        for item in stream.array_items():
+            record = _record(item)
+            if record:
+                yield record
+        return
+
+    stream.expect('{')
+    if stream.peek() == '}':
+        return
+    while True:
+        key = stream.value()
+        stream.expect(':')
+        if key in ('active', 'archived') and stream.peek() == '[':
+            for item in stream.array_items():
+                record = _record(item, is_archived=(key == 'archived'))
+                if record:
+                    yield record
+        else:
+            stream.value()  # baaki keys ignore
+        if stream.expect(',}') == '}':
+            return
+
+
+def iter_jsonl(f):
+    for line in f:
+        line = line.strip()
+        if line:
+            record = _record(json.loads(line))
+            if record:
+                yield record
+
+
+ARCHIVED_FOLDER = 'archived'
+
+
+class _BookmarkParser(HTMLParser):
+    # Netscape bookmark format: <DT><A HREF="..." ADD_DATE="..." TAGS="a,b">Title</A>
+    # Folders: <DT><H3>Name</H3><DL> ... </DL> - "Archived" folder (bulk_export ka) ke
+    # andar wale bookmarks archived import hote hain
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.current = None
+        self.heading = None     # <H3> text padh rahe hain
+        self.folder = None      # abhi band hua <H3> - agla <DL> iska folder hai
+        self.folders = []       # khule <DL> ke folder names (root ke liye None)
+
+    def _in_archived_folder(self):
+        return ARCHIVED_FOLDER in self.folders
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'h3':
+            self.heading = ''
+        elif tag == 'dl':
+            self.folders.append(self.folder)
+            self.folder = None
+        elif tag == 'a':
+            attrs = dict(attrs)
+            add_date = attrs.get('add_date')
+            created_at = None
+            if add_date and add_date.isdigit():
+                created_at = datetime.fromtimestamp(int(add_date), timezone.utc).replace(tzinfo=None)
+            self.current = {
+                'url': attrs.get('href'),
+                'title': '',
+                'tags': [t.strip() for t in (attrs.get('tags') or '').split(',') if t.strip()],
+                'is_archived': self._in_archived_folder(),
+                'created_at': created_at,
+            }
+
+    def handle_data(self, data):
+        if self.current is not None:
+            self.current['title'] += data
+        elif self.heading is not None:
+            self.heading += data
+
+    def handle_endtag(self, tag):
+        if tag == 'h3' and self.heading is not None:
+            self.folder = ' '.join(self.heading.split()).lower()
+            self.heading = None
+        elif tag == 'dl':
+            if self.folders:
+                self.folders.pop()
+        elif tag == 'a' and self.current is not None:
+            self.current['title'] = ' '.join(self.current['title'].split()) or None
+            self.records.append(self.current)
+            self.current = None
+
+
+def iter_bookmarks_html(f):
+    parser = _BookmarkParser()
+    while True:
+        chunk = f.read(READ_SIZE)
+        if not chunk:
+            break
+        parser.feed(chunk)
+        yield from parser.records
+        parser.records = []
+    parser.close()
+    yield from parser.records
+
+
+PARSERS = {
+    'json': iter_json,
+    'jsonl': iter_jsonl,
+    'html': iter_bookmarks_html,
+}
+
+
+def detect_format(filename):
+    name = (filename or '').lower()
+    if name.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    if name.endswith(('.html', '.htm')):
+        return 'html'
+    return 'json'
+
+
+# ---------- Batched insert ----------
+
+def _clean(record):
+    url = record.get('url')
+    if not isinstance(url, str):
+        return None
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.netloc or len(url) > 500:
+            return None
+        key = url_hash(url, parts)
+    except ValueError:
+        return None     # e.g. galat port number
+    title = record.get('title')
+    title = ' '.join(str(title).split())[:200] if title else None
+    tags = record.get('tags') or []
+    if isinstance(tags, str):
+        tags = tags.split(',')
+    return {
+        'url': url,
+        'key': key,
+        'title': title,
+        'tags': [str(t).strip() for t in tags if str(t).strip()],
+        'is_archived': bool(record.get('is_archived')),
+        'created_at': record.get('created_at'),
+    }
+
+
+def _insert_batch(batch, tag_ids, user_id, stats, pending, claim_titles=False):
+    # Batch ke andar duplicates hatao (normalized URL hash pe)
+    unique = {}
+    for record in batch:
+        unique.setdefault(record['key'], record)
+    stats['duplicates'] += len(batch) - len(unique)
+
+    # Database me pehle se hain? - url_hash unique index pe ek IN query per batch
+    existing = {row[0] for row in
+                db.session.query(URL.url_hash).filter(URL.url_hash.in_(list(unique)))}
+    records = [record for key, record in unique.items() if key not in existing]
+    stats['duplicates'] += len(unique) - len(records)
+    if not records:
+        return
+
+    now = _utcnow()
+    rows = [{
+        'url': record['url'],
+        'url_hash': record['key'],
+        'title': record['title'],
+        'title_status': 'ready' if record['title'] else 'pending',
+        # on_pending (isi process ka title_worker) fetch karega - doosre workers claim na karein
+        'title_claimed_at': now if claim_titles and not record['title'] else None,
+        'is_archived': record['is_archived'],
+        'user_id': user_id,
+        'created_at': record['created_at'] or now,
+    } for record in records]
+
+    # Multi-row INSERT ... RETURNING - order guarantee nahi maangte (SQLite pe woh
+    # row-by-row ho jata hai), batch me hashes unique hain isliye hash se map kar lo
+    result = db.session.execute(db.insert(URL).returning(URL.id, URL.url_hash), rows)
+    ids_by_hash = {hashed: url_id for url_id, hashed in result}
+    url_ids = [ids_by_hash[record['key']] for record in records]
+
+    links = [{'url_id': url_id, 'tag_id': tag_ids[name]}
+             for url_id, record in zip(url_ids, records)
+             for name in dict.fromkeys(record['tags']) if name in tag_ids]
+    if links:
+        db.session.execute(db.insert(URLTag), links)
+
+    db.session.commit()
+    fuzzy_index.mark_changed(url_ids)
+    stats['imported'] += len(rows)
+    pending.extend((url_id, record['url'])
+                   for url_id, record in zip(url_ids, records) if not record['title'])
+
+
+def import_records(records, batch_size=BATCH_SIZE, on_pending=None):
+    # on_pending(url_id, url) - bina title wale URLs ke liye (e.g. title_worker.submit)
+    stats = {'read': 0, 'imported': 0, 'duplicates': 0, 'skipped': 0, 'pending_titles': 0}
+    tag_ids = tag_registry.ids()
+    default_user = User.query.filter_by(email='default@example.com').first()
+    user_id = default_user.id if default_user else None
+
+    batch = []
+    pending = []
+    for record in records:
+        stats['read'] += 1
+        cleaned = _clean(record)
+        if cleaned is None:
+            stats['skipped'] += 1
+            continue
+        batch.append(cleaned)
+        if len(batch) >= batch_size:
+            _insert_batch(batch, tag_ids, user_id, stats, pending, on_pending is not None)
+            batch = []
+    if batch:
+        _insert_batch(batch, tag_ids, user_id, stats, pending, on_pending is not None)
+
+    stats['pending_titles'] = len(pending)
+    if on_pending:
+        for url_id, url in pending:
+            on_pending(url_id, url)
+    return stats
+
+
+def import_file(f, fmt='json', batch_size=BATCH_SIZE, on_pending=None):
+    # f binary ya text dono ho sakta hai (upload stream / open file)
+    if isinstance(f, io.TextIOBase):
+        text = f
+    else:
+        text = io.TextIOWrapper(f, encoding='utf-8', errors='replace')
+    try:
+        return import_records(PARSERS[fmt](text), batch_size, on_pending)
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Bulk import bookmarks into URL Manager')
+    parser.add_argument('path', nargs='?', default='urls.json',
+                        help='JSON, JSONL or bookmark HTML file (default: urls.json)')
+    parser.add_argument('--format', choices=sorted(PARSERS), help='default: from file extension')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--fetch-titles', action='store_true',
+                        help='fetch missing titles concurrently after inserting')
+    args = parser.parse_args(argv)
+
+    from app import app, get_title_worker, response_cache
+
+    print(f"🚀 Importing {args.path} ...")
+    started = datetime.now()
+    with app.app_context(), open(args.path, 'rb') as f:
+        title_worker = get_title_worker()
+        stats = import_file(f, args.format or detect_format(args.path), args.batch_size,
+                            on_pending=title_worker.submit if args.fetch_titles else None)
+        response_cache.bump()   # shared (database) backend pe web workers ko naya data dikhe
+
+    seconds = (datetime.now() - started).total_seconds()
+    print(f"🎉 Import completed in {seconds:.2f}s")
+    for key, value in stats.items():
+        print(f"📊 {key}: {value}")
+
+    if args.fetch_titles and stats['pending_titles']:
+        print(f"⏳ Fetching {stats['pending_titles']} titles ...")
+        title_worker.wait_idle()
+        print("✅ Titles fetched")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,298 @@
+import os
+import re
+import time
+import heapq
+import logging
+import threading
+from urllib.parse import urlsplit
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from models import db, URL
+
+log = logging.getLogger('url_manager.fuzzy_index')
+
+# ✅ FUZZY SEARCH INDEX - typo-tolerant search, process ke andar
+# Har URL ke title + hostname ke words ka inverted index (word -> url ids), aur
+# vocabulary pe trigram index (trigram -> words). Query ka har word pehle vocabulary
+# me fuzzy / prefix match hota hai ('pyhton' -> python, 'kube' -> kubernetes), unke
+# url ids ka intersection candidates dete hain, aur RapidFuzz (WRatio) unhe rank karta hai.
+# RapidFuzz pehli fuzzy query pe import hota hai (ORM event listeners neeche hamesha lagte hain).
+#
+# Index pehli fuzzy query pe banta hai, phir incremental:
+#   - ORM insert / update / delete (add, delete, archive, title aana) - commit ke baad
+#     ids 'changed' me jaate hain, agli query unhe ek IN query se reload karti hai
+#   - bulk insert (import, doosre workers) - har query pe id > max_id wale naye rows
+#   - mark_changed(ids) - Core bulk INSERT / UPDATE wale code paths (bulk_import, link_checker)
+# Doosre gunicorn workers ke title / delete changes MAX_AGE ke baad background rebuild se aate hain.
+MAX_AGE = float(os.environ.get('FUZZY_INDEX_MAX_AGE', 15 * 60))
+MIN_SCORE = 50          # RapidFuzz WRatio cutoff (0-100)
+TERM_SCORE = 75         # query word vs vocabulary word
+STRONG_TERM_SCORE = 90  # exact / prefix / lambe word me chhota typo
+MAX_TERM_MATCHES = 50   # ek query word kitne vocabulary words tak phaile
+MAX_PREFIX_MATCHES = 10 # 1-2 letter query word ke liye
+MAX_CANDIDATES = 500    # RapidFuzz ranking me max kitne documents
+LOAD_BATCH = 5000
+
+WORD_RE = re.compile(r'[^\W_]+')
+HOST_NOISE = {'www', 'com', 'org', 'net', 'io', 'co', 'in', 'html', 'http', 'https'}
+
+
+def _words(text):
+    return WORD_RE.findall(text.lower()) if text else []
+
+
+def _trigrams(word):
+    # Aage do space - prefix ke trigrams ('  p', ' py', 'pyt') bhi index me hon
+    padded = f'  {word}'
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _document(title, url):
+    try:
+        host = urlsplit(url or '').hostname or ''
+    except ValueError:
+        host = ''
+    host_words = [word for word in _words(host) if word not in HOST_NOISE]
+    text = ' '.join(_words(title) + host_words)
+    return text, set(text.split())
+
+
+class FuzzyIndex:
+    def __init__(self, max_age=MAX_AGE):
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self._ready = False
+        self._reset()
+
+    def _reset(self):
+        self._docs = {}         # url id -> (text, is_archived)
+        self._postings = {}     # word -> {url ids}
+        self._grams = {}        # trigram -> {words}
+        self._max_id = 0
+        self._changed = set()
+        self._built_at = 0.0
+        self._rebuilding = False
+        self._rebuild_changed = set()
+
+    # ---------- Index maintenance ----------
+
+    def _add(self, url_id, title, url, is_archived):
+        text, words = _document(title, url)
+        self._docs[url_id] = (text, bool(is_archived))
+        for word in words:
+            ids = self._postings.get(word)
+            if ids is None:
+                ids = self._postings[word] = set()
+                for gram in _trigrams(word):
+                    self._grams.setdefault(gram, set()).add(word)
+            ids.add(url_id)
+        if url_id > self._max_id:
+            self._max_id = url_id
+
+    def _remove(self, url_id):
+        doc = self._docs.pop(url_id, None)
+        if doc is None:
+            return
+        for word in set(doc[0].split()):
+            ids = self._postings.get(word)
+            if ids is None:
+                continue
+            ids.discard(url_id)
+            if not ids:
+                # Word ab kisi URL me nahi - vocabulary se bhi hatao
+                del self._postings[word]
+                for gram in _trigrams(word):
+                    words = self._grams.get(gram)
+                    if words is not None:
+                        words.discard(word)
+                        if not words:
+                            del self._grams[gram]
+
+    @staticmethod
+    def _columns():
+        return db.select(URL.id, URL.title, URL.url, URL.is_archived)
+
+    def build(self):
+        started = time.perf_counter()
+        with self._lock:
+            self._reset()
+            self._load_all()
+            self._built_at = time.monotonic()
+            self._ready = True
+        log.info('fuzzy index built docs=%d words=%d seconds=%.2f',
+                 len(self._docs), len(self._postings), time.perf_counter() - started)
+
+    def _load_all(self):
+        for rows in db.session.execute(self._columns().order_by(URL.id)
+                                       .execution_options(yield_per=LOAD_BATCH)).partitions():
+            for url_id, title, url, is_archived in rows:
+                self._add(url_id, title, url, is_archived)
+
+    def _rebuild_in_background(self, app):
+        # Naya index alag object me banao, tayyar hone pe swap - queries rukti nahi
+        def run():
+            try:
+                with app.app_context():
+                    fresh = FuzzyIndex(self.max_age)
+                    fresh.build()
+                with self._lock:
+                    self._docs, self._postings, self._grams = fresh._docs, fresh._postings, fresh._grams
+                    # Rebuild ke dauran aaye changes / naye rows naye index pe dobara lagenge
+                    self._changed |= self._rebuild_changed
+                    self._max_id = fresh._max_id
+                    self._built_at = fresh._built_at
+            except Exception as e:
+                log.exception('fuzzy index rebuild failed error=%s', e)
+            finally:
+                self._rebuilding = False
+
+        self._rebuilding = True
+        self._rebuild_changed = set()
+        threading.Thread(target=run, name='fuzzy-index-rebuild', daemon=True).start()
+
+    def sync(self):
+        # Query se pehle: pehli baar poora build, warna sirf naye / badle rows
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    self.build()
+            return
+        with self._lock:
+            changed, self._changed = self._changed, set()
+            max_id = self._max_id
+            if self._rebuilding:
+                self._rebuild_changed |= changed
+        rows = []
+        if changed:
+            rows = db.session.execute(self._columns().where(URL.id.in_(list(changed)))).all()
+        rows += db.session.execute(self._columns().where(URL.id > max_id).order_by(URL.id)).all()
+        with self._lock:
+            for url_id in changed:
+                self._remove(url_id)    # jo rows nahi mili woh delete ho chuki hain
+            if self._max_id not in self._docs:
+                # SQLite delete hue max id ko dobara de deta hai - sweep wahan se shuru ho
+                self._max_id = max(self._docs, default=0)
+            for url_id, title, url, is_archived in rows:
+                self._remove(url_id)
+                self._add(url_id, title, url, is_archived)
+            stale = (self.max_age and not self._rebuilding
+                     and time.monotonic() - self._built_at > self.max_age)
+        if stale:
+            from flask import current_app
+            self._rebuild_in_background(current_app._get_current_object())
+
+    def mark_changed(self, url_ids):
+        if self._ready:
+            with self._lock:
+                self._changed.update(url_ids)
+
+    def invalidate(self):
+        with self._lock:
+            self._ready = False
+            self._reset()
+
+    # ---------- Queries ----------
+
+    def _match_word(self, term):
+        # term -> [(score, word)] vocabulary ke milte-julte words (exact, prefix, ya typo)
+        if len(term) < 3:
+            # 1-2 letters pe typo ka matlab nahi - sirf prefix, sabse common words
+            words = [word for word in self._grams.get(f'  {term}'[-3:], ()) if word.startswith(term)]
+            words = heapq.nlargest(MAX_PREFIX_MATCHES, words, key=lambda word: len(self._postings[word]))
+            return [(100 if word == term else STRONG_TERM_SCORE, word) for word in words]
+
+        counts = {}
+        for gram in _trigrams(term):
+            for word in self._grams.get(gram, ()):
+                counts[word] = counts.get(word, 0) + 1
+        if not counts:
+            return []
+        # Sabse zyada trigrams share karne wale words hi RapidFuzz tak jaate hain
+        shortlist = heapq.nlargest(MAX_TERM_MATCHES * 4, counts, key=counts.get)
+        from rapidfuzz import fuzz     # pehli fuzzy query pe - worker boot me load nahi
+        matches = []
+        for word in shortlist:
+            score = fuzz.ratio(term, word)
+            if len(word) > len(term):
+                score = max(score, fuzz.ratio(term, word[:len(term)]) - 5)   # prefix match
+            if score >= TERM_SCORE:
+                matches.append((score, word))
+        matches.sort(reverse=True)
+        return matches[:MAX_TERM_MATCHES]
+
+    def _candidates(self, matched, strong_only):
+        term_sets = []
+        for matches in matched:
+            ids = set()
+            for score, word in matches:
+                if score >= STRONG_TERM_SCORE or not strong_only:
+                    ids |= self._postings[word]
+            term_sets.append(ids)
+        term_sets.sort(key=len)
+        return set.intersection(*term_sets) if term_sets else set()
+
+    def search(self, query, limit=20, is_archived=None):
+        # -> [(url_id, score)] score ke order me
+        terms = list(dict.fromkeys(_words(query)))
+        if not terms:
+            return []
+        self.sync()
+
+        with self._lock:
+            matched = [matches for matches in map(self._match_word, terms) if matches]
+            if not matched:
+                return []
+
+            # Pehle sirf pakke matches (exact / prefix) - kam pade to typo wale bhi,
+            # aur phir bhi kuch na mile to jo kisi bhi word se match kare
+            candidates = self._candidates(matched, strong_only=True)
+            if len(candidates) < limit:
+                candidates = self._candidates(matched, strong_only=False)
+            if not candidates:
+                candidates = set().union(*(self._postings[word] for matches in matched
+                                           for _, word in matches))
+            if is_archived is not None:
+                candidates = [url_id for url_id in candidates
+                              if self._docs[url_id][1] == is_archived]
+            if len(candidates) > MAX_CANDIDATES:
+                candidates = sorted(candidates)[-MAX_CANDIDATES:]    # naye URLs pehle
+            choices = {url_id: self._docs[url_id][0] for url_id in candidates}
+
+        from rapidfuzz import fuzz, process
+        processed = ' '.join(_words(query))
+        results = process.extract(processed, choices, scorer=fuzz.WRatio, processor=None,
+                                  limit=limit, score_cutoff=MIN_SCORE)
+        results.sort(key=lambda item: (-item[1], -item[2]))
+        return [(url_id, round(score, 1)) for _, score, url_id in results]
+
+    def stats(self):
+        with self._lock:
+            return {'ready': self._ready, 'docs': len(self._docs),
+                    'words': len(self._postings), 'trigrams': len(self._grams)}
+
+
+fuzzy_index = FuzzyIndex()
+
+
+# ORM se hue URL changes - commit ke baad hi index ko batao (rollback pe kuch nahi)
+@event.listens_for(URL, 'after_insert')
+@event.listens_for(URL, 'after_update')
+@event.listens_for(URL, 'after_delete')
+def _mark_url_changed(mapper, connection, target):
+    session = object_session(target)
+    if session is not None and target.id is not None:
+        session.info.setdefault('fuzzy_changed', set()).add(target.id)
+
+
+@event.listens_for(Session, 'after_commit')
+def _apply_url_changes(session):
+    changed = session.info.pop('fuzzy_changed', None)
+    if changed:
+        fuzzy_index.mark_changed(changed)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_url_changes(session):
+    session.info.pop('fuzzy_changed', None)
@@ -0,0 +1,14 @@
+# ✅ GUNICORN HOOKS - `gunicorn app:app` isi folder se yeh file khud load karta hai
+
+# Har worker boot pe: pending titles jinka lease nahi / expire ho gaya, woh is worker
+# ke title_worker me. Import / create_app / CLIs yeh nahi karte.
+def post_worker_init(worker):
+    from app import requeue_pending_titles
+    from models import db
+    with worker.wsgi.app_context():
+        try:
+            requeue_pending_titles()
+        except Exception as e:
+            # INIT_DB_ON_STARTUP=0 aur init-db abhi nahi chala - boot mat roko, /start se ho jayega
+            db.session.rollback()
+            worker.log.warning('pending titles not requeued on boot error=%s', e)
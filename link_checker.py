@@ -0,0 +1,254 @@
+import os
+import sys
+import time
+import logging
+import argparse
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from models import db, URL, CONNECTION_ERROR, is_broken
+from fuzzy_index import fuzzy_index
+from title_extractor import TIMEOUT, NO_TITLE, read_head, extract_title
+
+log = logging.getLogger('url_manager.link_checker')
+
+# ✅ LINK HEALTH CHECKER
+# Saved URLs ko dobara check karta hai - status code, last_checked aur (page badla ho
+# to) naya title row pe save hota hai. url table id order me batches me padha jata hai,
+# requests ek bounded thread pool me chalti hain. Ek dispatcher (main thread) per-host
+# politeness sambhalta hai - ek host pe max `per_host` requests ek saath aur do requests
+# ke beech `host_delay` seconds - taaki pool ke threads kabhi kisi host ke liye block na hon.
+# Pichli baar ka ETag / Last-Modified bhejte hain, unchanged page 304 deta hai (body nahi).
+#
+#   python link_checker.py                     # jo 24h se check nahi hue
+#   python link_checker.py --max-age 0 --workers 32
+BATCH_SIZE = 500
+WORKERS = int(os.environ.get('LINK_CHECK_WORKERS', 16))
+PER_HOST = int(os.environ.get('LINK_CHECK_PER_HOST', 2))
+HOST_DELAY = float(os.environ.get('LINK_CHECK_HOST_DELAY', 0.5))
+MAX_AGE_HOURS = float(os.environ.get('LINK_CHECK_MAX_AGE_HOURS', 24))
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
+def _make_session(pool_size):
+    # Har host ka connection pool reuse hota hai (keep-alive) - pool workers jitna bada
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = 'Mozilla/5.0 (URL Manager link checker)'
+    return session
+
+
+class LinkChecker:
+    def __init__(self, workers=WORKERS, per_host=PER_HOST, host_delay=HOST_DELAY,
+                 timeout=TIMEOUT, head_only=False):
+        self.workers = workers
+        self.per_host = per_host
+        self.host_delay = host_delay
+        self.timeout = timeout
+        self.head_only = head_only
+        self.session = _make_session(workers)
+
+    def check(self, url, etag=None, last_modified=None):
+        # -> (status, etag, last_modified, title); title sirf 200 HTML page pe
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        try:
+            if self.head_only:
+                response = self.session.head(url, headers=headers, timeout=self.timeout,
+                                             allow_redirects=True)
+                # Kuch servers HEAD support nahi karte - unke liye GET
+                if response.status_code not in (405, 501):
+                    return (response.status_code, response.headers.get('ETag'),
+                            response.headers.get('Last-Modified'), None)
+
+            with self.session.get(url, headers=headers, stream=True,
+                                  timeout=self.timeout) as response:
+                title = None
+                content_type = response.headers.get('Content-Type', 'text/html').lower()
+                if response.status_code == 200 and ('html' in content_type or 'xml' in content_type):
+                    title = extract_title(read_head(response), response)   # sirf <head> tak
+                return (response.status_code, response.headers.get('ETag'),
+                        response.headers.get('Last-Modified'), title)
+        except requests.RequestException as e:
+            log.debug('link check error url=%s error=%s', url, e)
+            return CONNECTION_ERROR, None, None, None
+
+    def run(self, batches, on_result):
+        # batches: rows (id, url, title, etag, last_modified) ki lists ka iterator
+        # on_result(row, result) dispatcher (main) thread me call hota hai
+        queues = OrderedDict()      # host -> deque(rows), round-robin order
+        active = {}                 # host -> requests chal rahi hain
+        next_at = {}                # host -> agli request kab shuru ho sakti hai
+        in_flight = {}              # future -> (host, row)
+        queued = 0
+        batches = iter(batches)
+        exhausted = False
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='link-check') as pool:
+            while True:
+                # Queue me kam rows bachi hon to agla batch padho
+                while not exhausted and queued < self.workers * 4:
+                    batch = next(batches, None)
+                    if batch is None:
+                        exhausted = True
+                        break
+                    for row in batch:
+                        host = (urlsplit(row.url or '').hostname or '').lower()
+                        queues.setdefault(host, deque()).append(row)
+                        queued += 1
+
+                # Jitne slots khali hain, ready hosts se requests shuru karo
+                now = time.monotonic()
+                wake_at = None
+                for host in list(queues):
+                    if len(in_flight) >= self.workers:
+                        break
+                    if active.get(host, 0) >= self.per_host:
+                        continue
+                    if next_at.get(host, 0) > now:
+                        wake_at = min(wake_at or next_at[host], next_at[host])
+                        continue
+                    rows = queues[host]
+                    row = rows.popleft()
+                    queued -= 1
+                    if rows:
+                        queues.move_to_end(host)    # baaki hosts ki baari pehle
+                    else:
+                        del queues[host]
+                    active[host] = active.get(host, 0) + 1
+                    next_at[host] = now + self.host_delay
+                    future = pool.submit(self.check, row.url, row.etag, row.last_modified)
+                    in_flight[future] = (host, row)
+
+                if not in_flight:
+                    if not queues and exhausted:
+                        break
+                    # Sab hosts politeness delay me hain
+                    time.sleep(max(0.0, (wake_at or now) - time.monotonic()))
+                    continue
+
+                timeout = max(0.0, wake_at - time.monotonic()) if wake_at else None
+                done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    host, row = in_flight.pop(future)
+                    active[host] -= 1
+                    if not active[host]:
+                        del active[host]
+                    on_result(row, future.result())
+
+
+def due_batches(max_age, batch_size=BATCH_SIZE, limit=None):
+    # id order me keyset batches - jo rows kabhi check nahi hui ya max_age se purani hain
+    cutoff = _utcnow() - max_age
+    last_id = 0
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+        rows = (db.session.query(URL.id, URL.url, URL.title, URL.etag, URL.last_modified)
+                .filter(URL.id > last_id,
+                        db.or_(URL.last_checked.is_(None), URL.last_checked <= cutoff))
+                .order_by(URL.id).limit(size).all())
+        db.session.commit()     # read transaction khatam - writes beech me aa sakein
+        if not rows:
+            return
+        last_id = rows[-1].id
+        if remaining is not None:
+            remaining -= len(rows)
+        yield rows
+
+
+def check_links(max_age=timedelta(hours=MAX_AGE_HOURS), batch_size=BATCH_SIZE, limit=None,
+                checker=None, on_commit=None):
+    checker = checker or LinkChecker()
+    stats = {'checked': 0, 'ok': 0, 'not_modified': 0, 'broken': 0,
+             'unreachable': 0, 'titles_updated': 0}
+    updates = []
+
+    def flush():
+        if updates:
+            db.session.execute(db.update(URL), updates)   # executemany UPDATE by primary key
+            db.session.commit()
+            fuzzy_index.mark_changed(update['id'] for update in updates if 'title' in update)
+            updates.clear()
+            if on_commit:
+                on_commit()
+
+    def on_result(row, result):
+        status, etag, last_modified, title = result
+        update = {'id': row.id, 'last_checked': _utcnow()}
+        if status == 304:
+            # Page nahi badla - purana status / ETag / title hi sahi
+            stats['not_modified'] += 1
+        else:
+            update['http_status'] = status
+        if status not in (304, CONNECTION_ERROR):
+            # Validators sirf asli response se - network blip pe pichla ETag na jaye
+            update['etag'] = etag[:200] if etag else None
+            update['last_modified'] = last_modified[:50] if last_modified else None
+        if status == CONNECTION_ERROR:
+            stats['unreachable'] += 1
+        elif is_broken(status):
+            stats['broken'] += 1
+        elif status != 304:
+            stats['ok'] += 1
+        if title and title != NO_TITLE and title != row.title:
+            update['title'] = title
+            update['title_status'] = 'ready'
+            stats['titles_updated'] += 1
+        updates.append(update)
+        stats['checked'] += 1
+        if len(updates) >= batch_size:
+            flush()
+
+    try:
+        checker.run(due_batches(max_age, batch_size, limit), on_result)
+    finally:
+        flush()     # beech me ruka (Ctrl+C) to bhi jo check ho chuka woh save ho
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Recheck saved links: status code, last checked, title')
+    parser.add_argument('--max-age', type=float, default=MAX_AGE_HOURS,
+                        help=f'recheck links not checked for this many hours (default: {MAX_AGE_HOURS:g}, 0 = all)')
+    parser.add_argument('--limit', type=int, help='check at most N links this run')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--workers', type=int, default=WORKERS, help='concurrent requests')
+    parser.add_argument('--per-host', type=int, default=PER_HOST, help='concurrent requests per host')
+    parser.add_argument('--host-delay', type=float, default=HOST_DELAY,
+                        help='seconds between requests to the same host')
+    parser.add_argument('--head-only', action='store_true', help='HEAD requests only, no title refresh')
+    args = parser.parse_args(argv)
+
+    from app import app, response_cache
+
+    checker = LinkChecker(args.workers, args.per_host, args.host_delay, head_only=args.head_only)
+    print("🔍 Checking links ...")
+    started = time.perf_counter()
+    with app.app_context():
+        # Har batch commit ke baad web workers ko naya status dikhe
+        stats = check_links(timedelta(hours=args.max_age), args.batch_size, args.limit,
+                            checker, on_commit=response_cache.bump)
+
+    seconds = time.perf_counter() - started
+    print(f"🎉 Checked {stats['checked']} links in {seconds:.2f}s "
+          f"({stats['checked'] / seconds if seconds else 0:.1f}/s)")
+    for key, value in stats.items():
+        print(f"📊 {key}: {value}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
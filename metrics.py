@@ -0,0 +1,194 @@
+import time
+import bisect
+import threading
+from functools import wraps
+
+from flask import g, request, has_request_context
+from sqlalchemy import event
+
+
+# ✅ METRICS - chhota in-process Prometheus registry (koi extra dependency nahi)
+# Route latency histograms, SQL query count/time (per request bhi) aur outbound
+# title fetch spans. /metrics pe Prometheus text format me expose hota hai.
+# Note: har gunicorn worker ke apne counters hain - Prometheus har scrape pe
+# jis worker pe pahuncha uska data dekhega.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100, 500)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(pairs):
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+class Counter:
+    kind = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield self.name, list(zip(self.labelnames, key)), value
+
+
+class Histogram:
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._values = {}   # labels -> [bucket counts..., sum, count]
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, list(state)) for key, state in self._values.items())
+        for key, state in items:
+            pairs = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                yield f'{self.name}_bucket', pairs + [('le', repr(float(bound)))], cumulative
+            yield f'{self.name}_bucket', pairs + [('le', '+Inf')], state[-1]
+            yield f'{self.name}_sum', pairs, state[-2]
+            yield f'{self.name}_count', pairs, state[-1]
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def counter(self, *args, **kwargs):
+        metric = Counter(*args, **kwargs)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, *args, **kwargs):
+        metric = Histogram(*args, **kwargs)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            for name, pairs, value in metric.samples():
+                lines.append(f'{name}{_labels(pairs)} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+REQUEST_LATENCY = registry.histogram(
+    'http_request_duration_seconds', 'HTTP request latency by route.',
+    ['route', 'method', 'status'])
+DB_QUERY_LATENCY = registry.histogram(
+    'db_query_duration_seconds', 'SQL statement latency by operation.',
+    ['operation'], buckets=QUERY_BUCKETS)
+DB_QUERIES_PER_REQUEST = registry.histogram(
+    'db_queries_per_request', 'SQL statements executed per HTTP request.',
+    ['route'], buckets=COUNT_BUCKETS)
+DB_TIME_PER_REQUEST = registry.histogram(
+    'db_time_per_request_seconds', 'Total SQL time per HTTP request.',
+    ['route'], buckets=QUERY_BUCKETS)
+TITLE_FETCH_LATENCY = registry.histogram(
+    'title_fetch_duration_seconds', 'Outbound page title fetch latency.',
+    ['outcome'])
+TITLE_FETCHES = registry.counter(
+    'title_fetch_total', 'Outbound page title fetches by outcome.', ['outcome'])
+
+
+def _route():
+    return request.url_rule.rule if request.url_rule else 'unmatched'
+
+
+# ---------- Flask + SQLAlchemy hooks ----------
+
+def init_app(app, engine):
+    @app.before_request
+    def _start_timer():
+        g.request_started = time.perf_counter()
+        g.query_count = 0
+        g.query_time = 0.0
+
+    @app.after_request
+    def _record_request(response):
+        started = g.get('request_started')
+        if started is not None:
+            route = _route()
+            REQUEST_LATENCY.observe(time.perf_counter() - started, route=route,
+                                    method=request.method, status=response.status_code)
+            DB_QUERIES_PER_REQUEST.observe(g.get('query_count', 0), route=route)
+            DB_TIME_PER_REQUEST.observe(g.get('query_time', 0.0), route=route)
+        return response
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _query_start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _query_end(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info['query_started'].pop()
+        elapsed = time.perf_counter() - started
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else 'OTHER'
+        DB_QUERY_LATENCY.observe(elapsed, operation=operation)
+        if has_request_context():
+            g.query_count = g.get('query_count', 0) + 1
+            g.query_time = g.get('query_time', 0.0) + elapsed
+
+    @event.listens_for(engine, 'handle_error')
+    def _query_failed(context):
+        # Fail hui query ka after_cursor_execute nahi aata - stack saaf rakho
+        if context.connection is not None:
+            stack = context.connection.info.get('query_started')
+            if stack:
+                stack.pop()
+
+
+def timed_fetch(fetch):
+    # Title fetch ke around span - ok / error outcome ke saath
+    @wraps(fetch)
+    def wrapper(url):
+        started = time.perf_counter()
+        outcome = 'error'
+        try:
+            result = fetch(url)
+            outcome = 'ok'
+            return result
+        finally:
+            TITLE_FETCH_LATENCY.observe(time.perf_counter() - started, outcome=outcome)
+            TITLE_FETCHES.inc(outcome=outcome)
+    return wrapper
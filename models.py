@@ -0,0 +1,90 @@
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.dialects import sqlite
+
+# ✅ MODELS - alag file me taaki app.py aur scripts (bulk_import etc.) dono import kar sakein
+db = SQLAlchemy()
+
+# SQLite CURRENT_TIMESTAMP seconds tak store karta hai - bind parameter bhi
+# same format me hona chahiye, warna keyset cursor ka string comparison galat hoga
+SQLITE_DATETIME = sqlite.DATETIME(
+    storage_format='%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d'
+)
+
+# ✅ LINK HEALTH STATUS - link_checker.py likhta hai, templates / API padhte hain
+# (yahan isliye ki app.py ko requests import na karna pade)
+CONNECTION_ERROR = 0    # http_status jab response hi nahi aaya
+
+def is_broken(http_status):
+    return http_status is not None and (http_status == CONNECTION_ERROR or http_status >= 400)
+
+# ✅ MODELS (TERA EXISTING CODE - BILKUL SAME)
+class User(db.Model):
+    __tablename__ = 'user'
+    id = db.Column(db.Integer, primary_key=True)
+    email = db.Column(db.String(100), unique=True, nullable=False)
+    password_hash = db.Column(db.String(200), nullable=False)
+    created_at = db.Column(db.DateTime, default=db.func.now())
+
+# ✅ URL MODEL (WITH USER_ID)
+class URL(db.Model):
+    __tablename__ = 'url'
+    id = db.Column(db.Integer, primary_key=True)
+    url = db.Column(db.String(500))
+    title = db.Column(db.String(200))
+    is_archived = db.Column(db.Boolean, default=False)
+    title_status = db.Column(db.String(10), default='ready')  # pending / ready / failed
+    # Pending title kis process ke title_worker me queue hai - lease, worker renew karta
+    # rehta hai; expire ho gaya (worker mar gaya) to boot / /start pe dobara claim hota hai
+    title_claimed_at = db.Column(db.DateTime().with_variant(SQLITE_DATETIME, 'sqlite'))
+    url_hash = db.Column(db.String(64))  # sha256(normalized url) - duplicate check (urlnorm.py)
+    # ✅ LINK HEALTH - link_checker.py bharta hai (0 = connection error / timeout)
+    http_status = db.Column(db.Integer)
+    last_checked = db.Column(db.DateTime().with_variant(SQLITE_DATETIME, 'sqlite'))
+    etag = db.Column(db.String(200))           # conditional recheck ke liye
+    last_modified = db.Column(db.String(50))   # server ka Last-Modified header, as-is
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'))  # ✅ FOREIGN KEY
+    created_at = db.Column(db.DateTime().with_variant(SQLITE_DATETIME, 'sqlite'),
+                           default=db.func.now())
+
+    # ✅ INDEXES - naam schema_migrations.py wale hi hain (purane DB pe wahi banata hai)
+    __table_args__ = (
+        db.Index('ix_url_archived_created_id', 'is_archived', 'created_at', 'id'),
+        db.Index('ix_url_created_at', 'created_at'),
+        db.Index('ix_url_url_hash', 'url_hash', unique=True),
+        db.Index('ix_url_last_checked', 'last_checked'),
+    )
+
+    # ✅ RELATIONSHIPS - tags ek hi IN query me load hote hain (selectin)
+    url_tags = db.relationship('URLTag', back_populates='url', cascade='all, delete-orphan')
+    tags = db.relationship('Tag', secondary='urltag', lazy='selectin',
+                           order_by='URLTag.id', viewonly=True)
+
+class Tag(db.Model):
+    __tablename__ = 'tag'
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(50), unique=True)
+    color = db.Column(db.String(7))
+
+    url_tags = db.relationship('URLTag', back_populates='tag')
+
+class URLTag(db.Model):
+    __tablename__ = 'urltag'
+    id = db.Column(db.Integer, primary_key=True)
+    url_id = db.Column(db.Integer, db.ForeignKey('url.id'))
+    tag_id = db.Column(db.Integer, db.ForeignKey('tag.id'))
+
+    # (url_id, tag_id) unique - yehi url_id lookups ka index bhi hai
+    __table_args__ = (
+        db.Index('uq_urltag_url_tag', 'url_id', 'tag_id', unique=True),
+        db.Index('ix_urltag_tag_id', 'tag_id'),
+    )
+
+    url = db.relationship('URL', back_populates='url_tags')
+    tag = db.relationship('Tag', back_populates='url_tags')
+
+# ✅ APP STATE - chhota key/value table (e.g. response cache ka data generation counter)
+class AppState(db.Model):
+    __tablename__ = 'app_state'
+    key = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.BigInteger, default=0)
+    updated_at = db.Column(db.DateTime, default=db.func.now())
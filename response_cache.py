@@ -0,0 +1,172 @@
+import time
+import hashlib
+import secrets
+import threading
+from functools import wraps
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from flask import current_app, request, session, make_response
+
+from models import db, AppState
+
+
+# ✅ RESPONSE CACHE - data generation counter pe keyed
+# Data sirf mutating routes (/add, /delete, /archive, ...) se badalta hai. Har write
+# generation++ karta hai; reads (/, /search, /api/urls) rendered body cache se dete hain
+# aur ETag / Last-Modified ke saath conditional request pe 304 bhejte hain.
+#
+# Generation store:
+#   local    - process ke andar counter (single gunicorn worker ke liye); restart pe 0 se
+#              shuru hota hai, isliye ETag me har boot ka random token bhi hai - warna
+#              restart ke baad purana ETag phir match karke stale page pe 304 de deta
+#   database - 'app_state' table row, saare workers same counter dekhte hain
+
+
+class LocalGeneration:
+    def __init__(self):
+        self.token = secrets.token_hex(8)   # per-process boot token (ETag me)
+        self._lock = threading.Lock()
+        self._value = 0
+        self._updated_at = time.time()
+
+    def current(self):
+        return self._value, self._updated_at
+
+    def bump(self):
+        with self._lock:
+            self._value += 1
+            self._updated_at = time.time()
+
+
+class DatabaseGeneration:
+    KEY = 'data_generation'
+    token = ''      # counter DB me persist hota hai - restart pe repeat nahi hota
+
+    def current(self):
+        row = db.session.get(AppState, self.KEY)
+        if row is None:
+            return 0, 0.0
+        updated_at = row.updated_at.replace(tzinfo=timezone.utc).timestamp() if row.updated_at else 0.0
+        return row.value, updated_at
+
+    def bump(self):
+        # Apni alag connection/transaction - request ki session state pe asar nahi
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        table = AppState.__table__
+        with db.engine.begin() as conn:
+            updated = conn.execute(
+                table.update().where(table.c.key == self.KEY)
+                .values(value=table.c.value + 1, updated_at=now))
+            if not updated.rowcount:
+                conn.execute(table.insert().values(key=self.KEY, value=1, updated_at=now))
+
+
+class CacheStore:
+    # Ek app ka cache - generation store + rendered responses ka LRU
+    def __init__(self, backend='local', max_entries=256, max_bytes=32 * 1024 * 1024):
+        self.generation = DatabaseGeneration() if backend == 'database' else LocalGeneration()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # key -> (body, mimetype, status)
+        self._size = 0
+
+    # ---------- LRU storage ----------
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry):
+        size = len(entry[0])
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old[0])
+            self._entries[key] = entry
+            self._size += size
+            # Size/entries limit ke bahar - sabse purane nikal do
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted[0])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class ResponseCache:
+    # Flask extension (db = SQLAlchemy() jaisa) - module-level object sirf decorators ke
+    # liye, har app ka apna CacheStore app.extensions me (create_app -> init_app)
+    def init_app(self, app):
+        app.extensions['response_cache'] = CacheStore(
+            backend=app.config.get('RESPONSE_CACHE_BACKEND', 'local'),
+            max_entries=app.config.get('RESPONSE_CACHE_ENTRIES', 256),
+            max_bytes=app.config.get('RESPONSE_CACHE_BYTES', 32 * 1024 * 1024),
+        )
+
+    @property
+    def store(self):
+        return current_app.extensions['response_cache']
+
+    def clear(self):
+        self.store.clear()
+
+    # ---------- Decorators ----------
+
+    def bump(self):
+        self.store.generation.bump()
+
+    def invalidates(self, view):
+        # Mutating routes - response ke baad generation++
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                return view(*args, **kwargs)
+            finally:
+                self.bump()
+        return wrapper
+
+    def cached(self, view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            # Flash messages har user ke liye alag hain - aise page cache nahi karte
+            if '_flashes' in session:
+                return view(*args, **kwargs)
+
+            store = self.store
+            generation, updated_at = store.generation.current()
+            path = request.full_path
+            etag = hashlib.sha1(f'{store.generation.token}:{generation}:{path}'.encode()).hexdigest()[:20]
+            last_modified = datetime.fromtimestamp(int(updated_at), timezone.utc)
+
+            if etag in request.if_none_match or (
+                    not request.if_none_match and request.if_modified_since
+                    and request.if_modified_since >= last_modified):
+                response = make_response('', 304)
+            else:
+                key = (generation, path)
+                entry = store.get(key)
+                if entry is None:
+                    response = make_response(view(*args, **kwargs))
+                    if response.status_code != 200:
+                        return response
+                    entry = (response.get_data(), response.mimetype, response.status_code)
+                    store.put(key, entry)
+                else:
+                    response = make_response(entry[0], entry[2])
+                    response.mimetype = entry[1]
+
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            response.cache_control.no_cache = True  # browser har baar revalidate kare (304)
+            return response
+        return wrapper
@@ -0,0 +1,136 @@
+import sys
+import logging
+import argparse
+from datetime import datetime, timezone
+
+from models import db
+
+log = logging.getLogger('url_manager.migrations')
+
+# ✅ VERSIONED SCHEMA MIGRATIONS
+# db.create_all() sirf nayi tables banata hai - purani tables me columns / indexes
+# nahi jodta. Yahan har migration ka ek version number hai; jo apply ho chuke
+# woh 'schema_migrations' table me record hote hain, baaki order me chalte hain.
+# Har step idempotent hai, taaki fresh database (jahan create_all ne sab bana diya)
+# pe bhi safely chal sake.
+#
+#   python schema_migrations.py            # pending migrations apply karo
+#   python schema_migrations.py --status   # kya apply hua, kya baaki hai
+
+
+def _columns(conn, table):
+    return {col['name'] for col in db.inspect(conn).get_columns(table)}
+
+
+def _add_column(conn, table, name, ddl):
+    if name not in _columns(conn, table):
+        conn.execute(db.text(f'ALTER TABLE {table} ADD COLUMN {name} {ddl}'))
+
+
+def _create_index(conn, name, table, columns, unique=False):
+    kind = 'UNIQUE INDEX' if unique else 'INDEX'
+    conn.execute(db.text(f'CREATE {kind} IF NOT EXISTS {name} ON {table} ({columns})'))
+
+
+def add_title_status(conn):
+    _add_column(conn, 'url', 'title_status', "VARCHAR(10) DEFAULT 'ready'")
+
+
+def add_listing_indexes(conn):
+    # (is_archived, created_at, id) - section filter + keyset order ek hi index se
+    _create_index(conn, 'ix_url_archived_created_id', 'url', 'is_archived, created_at, id')
+    _create_index(conn, 'ix_url_created_at', 'url', 'created_at')
+    _create_index(conn, 'ix_urltag_tag_id', 'urltag', 'tag_id')
+
+
+def add_urltag_unique(conn):
+    # Pehle duplicate (url_id, tag_id) rows hatao - sabse purana (min id) rakho
+    conn.execute(db.text("""
+        DELETE FROM urltag WHERE id NOT IN (
+            SELECT keep_id FROM (
+                SELECT MIN(id) AS keep_id FROM urltag GROUP BY url_id, tag_id
+            ) AS keepers
+        )
+    """))
+    # url_id se shuru hota hai - delete / tag lookups by url_id bhi isi se
+    _create_index(conn, 'uq_urltag_url_tag', 'urltag', 'url_id, tag_id', unique=True)
+
+
+def add_url_hash(conn):
+    # Purane rows ka hash backfill_url_hash.py batches me bharta hai (NULL unique me allowed)
+    _add_column(conn, 'url', 'url_hash', 'VARCHAR(64)')
+    _create_index(conn, 'ix_url_url_hash', 'url', 'url_hash', unique=True)
+
+
+def add_link_health(conn):
+    _add_column(conn, 'url', 'http_status', 'INTEGER')
+    _add_column(conn, 'url', 'last_checked', 'TIMESTAMP')
+    _add_column(conn, 'url', 'etag', 'VARCHAR(200)')
+    _add_column(conn, 'url', 'last_modified', 'VARCHAR(50)')
+    _create_index(conn, 'ix_url_last_checked', 'url', 'last_checked')
+
+
+def add_title_claim(conn):
+    _add_column(conn, 'url', 'title_claimed_at', 'TIMESTAMP')
+
+
+MIGRATIONS = [
+    (1, 'url.title_status column', add_title_status),
+    (2, 'url / urltag listing indexes', add_listing_indexes),
+    (3, 'urltag (url_id, tag_id) unique', add_urltag_unique),
+    (4, 'url.url_hash column + unique index', add_url_hash),
+    (5, 'url link health columns', add_link_health),
+    (6, 'url.title_claimed_at lease column', add_title_claim),
+]
+
+VERSION_TABLE = db.Table(
+    'schema_migrations', db.MetaData(),
+    db.Column('version', db.Integer, primary_key=True),
+    db.Column('name', db.String(100)),
+    db.Column('applied_at', db.DateTime),
+)
+
+
+def applied_versions():
+    VERSION_TABLE.create(db.engine, checkfirst=True)
+    with db.engine.connect() as conn:
+        return {row[0] for row in conn.execute(db.select(VERSION_TABLE.c.version))}
+
+
+def run_migrations():
+    done = applied_versions()
+    applied = []
+    for version, name, migrate in MIGRATIONS:
+        if version in done:
+            continue
+        # Har migration apni transaction me - fail hua to aadha kaam commit nahi hoga
+        with db.engine.begin() as conn:
+            migrate(conn)
+            conn.execute(VERSION_TABLE.insert().values(
+                version=version, name=name,
+                applied_at=datetime.now(timezone.utc).replace(tzinfo=None)))
+        log.info('migration applied version=%d name=%r', version, name)
+        applied.append(version)
+    return applied
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Apply URL Manager schema migrations')
+    parser.add_argument('--status', action='store_true', help='only show migration status')
+    args = parser.parse_args(argv)
+
+    from app import app
+
+    with app.app_context():
+        if args.status:
+            done = applied_versions()
+            for version, name, _ in MIGRATIONS:
+                print(f"{'✅' if version in done else '⏳'} {version}: {name}")
+            return
+        db.create_all()
+        applied = run_migrations()
+        print(f"✅ Schema up to date ({len(applied)} migrations applied)")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
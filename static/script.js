@@ -76,6 +76,72 @@ document.addEventListener('DOMContentLoaded', function() {
     document.addEventListener('click', function() {
         closeAllDropdowns();
     });
+
+    // Search box autocomplete - fuzzy matches (typos bhi) as you type
+    const autocompleteInput = document.querySelector('.search-form input[name="q"]');
+    const autocompleteBox = document.getElementById('autocomplete');
+
+    if (autocompleteInput && autocompleteBox) {
+        let autocompleteTimeout;
+        let autocompleteRequest = 0;
+
+        const hideSuggestions = () => {
+            autocompleteBox.hidden = true;
+            autocompleteBox.innerHTML = '';
+        };
+
+        autocompleteInput.addEventListener('input', function() {
+            clearTimeout(autocompleteTimeout);
+            const query = this.value.trim();
+            if (query.length < 2) {
+                hideSuggestions();
+                return;
+            }
+
+            autocompleteTimeout = setTimeout(async () => {
+                const requestId = ++autocompleteRequest;
+                try {
+                    const response = await fetch('/api/autocomplete?q=' + encodeURIComponent(query));
+                    const data = await response.json();
+                    // Purana (slow) response naye wale ko overwrite na kare
+                    if (requestId !== autocompleteRequest) return;
+                    renderSuggestions(data.suggestions || []);
+                } catch (err) {
+                    console.error('Autocomplete failed: ', err);
+                }
+            }, 150);
+        });
+
+        function renderSuggestions(suggestions) {
+            autocompleteBox.innerHTML = '';
+            suggestions.forEach(item => {
+                const link = document.createElement('a');
+                link.href = item.url;
+                link.target = '_blank';
+                link.className = 'autocomplete-item' + (item.is_archived ? ' archived' : '');
+
+                const title = document.createElement('span');
+                title.className = 'autocomplete-title';
+                title.textContent = item.title || item.url;
+                const url = document.createElement('span');
+                url.className = 'autocomplete-url';
+                url.textContent = item.url;
+
+                link.append(title, url);
+                autocompleteBox.appendChild(link);
+            });
+            autocompleteBox.hidden = suggestions.length === 0;
+        }
+
+        autocompleteInput.addEventListener('keydown', function(e) {
+            if (e.key === 'Escape') hideSuggestions();
+        });
+        document.addEventListener('click', function(e) {
+            if (!autocompleteBox.contains(e.target) && e.target !== autocompleteInput) {
+                hideSuggestions();
+            }
+        });
+    }
 	
 	
 	// Real-time search functionality - DOMContentLoaded KE ANDAR
@@ -0,0 +1,67 @@
+import threading
+from collections import namedtuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from models import db, Tag
+
+
+# ✅ TAG REGISTRY - 'tag' table ek baar load karke process me cache
+# Tags bahut kam badalte hain (sirf seeding), isliye har request pe
+# Tag.query.filter_by(name=...) ki zarurat nahi. Tag insert/update/delete
+# hone pe cache apne aap invalidate ho jata hai.
+TagInfo = namedtuple('TagInfo', ['id', 'name', 'color'])
+
+
+class TagRegistry:
+    def __init__(self):
+        self._tags = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        tags = self._tags
+        if tags is None:
+            with self._lock:
+                if self._tags is None:
+                    rows = db.session.query(Tag.id, Tag.name, Tag.color).order_by(Tag.id)
+                    self._tags = {name: TagInfo(tag_id, name, color) for tag_id, name, color in rows}
+                tags = self._tags
+        return tags
+
+    def get(self, name):
+        return self._load().get(name)
+
+    def all(self):
+        return list(self._load().values())
+
+    def ids(self):
+        return {name: tag.id for name, tag in self._load().items()}
+
+    def colors(self):
+        return {name: tag.color for name, tag in self._load().items()}
+
+    def invalidate(self):
+        with self._lock:
+            self._tags = None
+
+
+tag_registry = TagRegistry()
+
+
+# Commit ke baad invalidate karo - flush ke time karte to dusra thread
+# uncommitted state se pehle hi purana data dobara load kar sakta tha
+@event.listens_for(Tag, 'after_insert')
+@event.listens_for(Tag, 'after_update')
+@event.listens_for(Tag, 'after_delete')
+def _mark_tags_changed(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info['tags_changed'] = True
+
+
+@event.listens_for(Session, 'after_commit')
+@event.listens_for(Session, 'after_rollback')
+def _invalidate_tag_registry(session):
+    if session.info.pop('tags_changed', False):
+        tag_registry.invalidate()
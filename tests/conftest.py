@@ -0,0 +1,66 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+from models import db, URL, URLTag  # noqa: E402
+from bulk_import import import_records  # noqa: E402
+from fuzzy_index import fuzzy_index  # noqa: E402
+
+TAG_NAMES = ('work', 'programming', 'research', 'personal', 'news')
+
+
+# ✅ TEST APP - create_app(config) ek temp SQLite file pe, poore run ke liye ek baar.
+# Har test se pehle url / urltag khaali aur response cache naya.
+@pytest.fixture(scope='session')
+def flask_app(tmp_path_factory):
+    db_path = tmp_path_factory.mktemp('db') / 'test.db'
+    return app_module.create_app({
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}',
+        'SECRET_KEY': 'test-secret-key',
+    })
+
+
+@pytest.fixture
+def app(flask_app):
+    with flask_app.app_context():
+        db.session.execute(db.delete(URLTag))
+        db.session.execute(db.delete(URL))
+        db.session.commit()
+        app_module.response_cache.clear()
+        app_module.response_cache.bump()
+    fuzzy_index.invalidate()
+    yield flask_app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def seed_urls(app):
+    # seed_urls(n) - n tagged URLs (har 5th archived), bulk_import pipeline se
+    counter = {'next': 0}
+
+    def seed(count, host='example.com'):
+        now = datetime(2026, 1, 1)
+        start = counter['next']
+        counter['next'] += count
+        records = [{
+            'url': f'https://{host}/page/{i}',
+            'title': f'Page {i}',
+            'tags': [TAG_NAMES[i % len(TAG_NAMES)], TAG_NAMES[(i + 1) % len(TAG_NAMES)]],
+            'is_archived': i % 5 == 0,
+            'created_at': now + timedelta(seconds=i),
+        } for i in range(start, start + count)]
+        with app.app_context():
+            stats = import_records(records)
+            app_module.response_cache.bump()
+        return stats
+
+    return seed
@@ -0,0 +1,22 @@
+import pytest
+
+
+def test_api_urls_pages_through_section(client, seed_urls):
+    seed_urls(25)   # 20 active
+    seen = []
+    cursor = ''
+    while True:
+        page = client.get(f'/api/urls?section=active&limit=8&cursor={cursor}').get_json()
+        seen += [item['url'] for item in page['urls']]
+        cursor = page['next_cursor']
+        if not cursor:
+            break
+    assert len(seen) == len(set(seen)) == 20
+
+
+@pytest.mark.parametrize('cursor', ['not-a-cursor', 'Zm9vYmFy', '%%%'])
+def test_api_urls_rejects_malformed_cursor(client, seed_urls, cursor):
+    seed_urls(5)
+    response = client.get(f'/api/urls?section=active&cursor={cursor}')
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'invalid cursor'}
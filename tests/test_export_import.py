@@ -0,0 +1,46 @@
+import io
+
+import pytest
+
+from models import db, URL, URLTag
+
+
+def snapshot(app):
+    with app.app_context():
+        return sorted((url.url, url.title, tuple(sorted(tag.name for tag in url.tags)),
+                       bool(url.is_archived), url.created_at)
+                      for url in URL.query.all())
+
+
+@pytest.mark.parametrize('fmt', ['json', 'jsonl', 'html'])
+def test_export_import_round_trip(app, client, seed_urls, fmt):
+    seed_urls(25)
+    before = snapshot(app)
+    assert any(row[3] for row in before) and not all(row[3] for row in before)
+
+    exported = client.get(f'/export?format={fmt}')
+    assert exported.status_code == 200
+    payload = exported.get_data()     # streaming body - rows delete hone se pehle padho
+
+    with app.app_context():
+        db.session.execute(db.delete(URLTag))
+        db.session.execute(db.delete(URL))
+        db.session.commit()
+
+    response = client.post('/import', data={'file': (io.BytesIO(payload), f'urls.{fmt}')},
+                           content_type='multipart/form-data')
+    assert response.status_code == 302
+    assert snapshot(app) == before
+
+
+def test_html_import_reads_archived_folder(app):
+    from bulk_import import iter_bookmarks_html
+
+    page = io.StringIO(
+        '<DL><p>\n'
+        '  <DT><H3>Reading</H3>\n  <DL><p>\n    <DT><A HREF="https://a.example/">A</A>\n  </DL><p>\n'
+        '  <DT><H3>Archived</H3>\n  <DL><p>\n    <DT><A HREF="https://b.example/">B</A>\n  </DL><p>\n'
+        '  <DT><A HREF="https://c.example/">C</A>\n'
+        '</DL><p>\n')
+    assert [(r['url'], r['is_archived']) for r in iter_bookmarks_html(page)] == [
+        ('https://a.example/', False), ('https://b.example/', True), ('https://c.example/', False)]
@@ -0,0 +1,147 @@
+import socket
+import threading
+from datetime import timedelta
+
+import pytest
+
+from benchmarks.stub_server import start_stub_server
+from bulk_import import import_records
+from link_checker import LinkChecker, check_links
+from models import URL
+
+# Stub server 0.0.0.0 pe - 127.0.0.x alag alag "hosts" ki tarah dikhte hain
+ALL = timedelta(0)
+
+
+@pytest.fixture(scope='module')
+def stub_port():
+    server, _ = start_stub_server(host='0.0.0.0')
+    yield server.server_address[1]
+    server.shutdown()
+
+
+@pytest.fixture
+def closed_port():
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def add_links(app, urls):
+    with app.app_context():
+        import_records({'url': url, 'title': 'Old title', 'tags': []} for url in urls)
+
+
+def rows(app):
+    with app.app_context():
+        return {url.url: url for url in URL.query.order_by(URL.id)}
+
+
+def run_check(app, checker=None, max_age=ALL):
+    with app.app_context():
+        return check_links(max_age, checker=checker or LinkChecker(workers=4, host_delay=0))
+
+
+def test_status_and_last_checked_stored(app, stub_port):
+    url = f'http://127.0.0.1:{stub_port}/ok?title=Fresh'
+    add_links(app, [url])
+
+    stats = run_check(app)
+
+    row = rows(app)[url]
+    assert stats['checked'] == 1 and stats['ok'] == 1
+    assert row.http_status == 200
+    assert row.last_checked is not None
+
+
+def test_broken_links_reported(app, client, stub_port, closed_port):
+    urls = [f'http://127.0.0.1:{stub_port}/missing?status=404',
+            f'http://127.0.0.1:{stub_port}/error?status=500',
+            f'http://127.0.0.1:{closed_port}/down']
+    add_links(app, urls)
+
+    stats = run_check(app)
+
+    assert stats['broken'] == 2 and stats['unreachable'] == 1
+    saved = rows(app)
+    assert [saved[url].http_status for url in urls] == [404, 500, 0]
+    api = {item['url']: item for item in client.get('/api/urls').get_json()['urls']}
+    assert all(api[url]['is_broken'] for url in urls)
+
+
+def test_changed_title_refreshes_and_etag_rerun_keeps_it(app, stub_port):
+    url = f'http://127.0.0.1:{stub_port}/page?title=New+title&etag=v1'
+    add_links(app, [url])
+
+    first = run_check(app)
+    row = rows(app)[url]
+    assert first['titles_updated'] == 1
+    assert row.title == 'New title' and row.etag == '"v1"'
+    first_checked = row.last_checked
+
+    second = run_check(app)     # If-None-Match: "v1" -> 304
+    row = rows(app)[url]
+    assert second['not_modified'] == 1 and second['titles_updated'] == 0
+    assert row.http_status == 200      # 304 pichla asli status nahi mitata
+    assert row.last_checked >= first_checked
+    assert row.title == 'New title' and row.etag == '"v1"'
+
+
+class BlipChecker(LinkChecker):
+    def check(self, url, etag=None, last_modified=None):
+        return 0, None, None, None      # connection error / timeout
+
+
+def test_connection_error_keeps_validators(app, stub_port):
+    url = f'http://127.0.0.1:{stub_port}/page?title=Stable&etag=v7'
+    add_links(app, [url])
+    run_check(app)
+
+    stats = run_check(app, BlipChecker(workers=1, host_delay=0))
+
+    row = rows(app)[url]
+    assert stats['unreachable'] == 1
+    assert row.http_status == 0
+    assert row.etag == '"v7"' and row.title == 'Stable'
+
+
+def test_recently_checked_links_skipped(app, stub_port):
+    add_links(app, [f'http://127.0.0.1:{stub_port}/ok'])
+    run_check(app)
+    assert run_check(app, max_age=timedelta(hours=1))['checked'] == 0
+
+
+class TrackingChecker(LinkChecker):
+    # Har host pe ek saath kitni requests chal rahi hain - max record karo
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock = threading.Lock()
+        self.running = {}
+        self.peak = {}
+
+    def check(self, url, etag=None, last_modified=None):
+        host = url.split('/')[2]
+        with self.lock:
+            self.running[host] = self.running.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.running[host])
+        try:
+            return super().check(url, etag, last_modified)
+        finally:
+            with self.lock:
+                self.running[host] -= 1
+
+
+def test_per_host_limit_never_exceeded(app, stub_port):
+    hosts = [f'127.0.0.{i}:{stub_port}' for i in (1, 2, 3)]
+    add_links(app, [f'http://{host}/page/{i}?latency=0.05' for i in range(12) for host in hosts])
+
+    checker = TrackingChecker(workers=8, per_host=2, host_delay=0)
+    stats = run_check(app, checker)
+
+    assert stats['checked'] == 36
+    assert set(checker.peak) == set(hosts)
+    assert max(checker.peak.values()) <= 2
+    # 8 workers, 3 hosts x 2 - limit hi rok raha tha, pool nahi
+    assert max(checker.peak.values()) == 2
@@ -0,0 +1,37 @@
+import pytest
+
+# ✅ N+1 GUARD - listing routes ki SQL query count collection size pe depend nahi karni chahiye
+PAGES = ['/', '/api/urls?section=active', '/api/urls?section=archived', '/api/urls?section=active&limit=200']
+
+
+def query_counts(client):
+    counts = {}
+    for path in PAGES:
+        response = client.get(path)
+        assert response.status_code == 200
+        counts[path] = int(response.headers['X-Query-Count'])
+    return counts
+
+
+@pytest.fixture
+def debug_client(app, client, monkeypatch):
+    monkeypatch.setitem(app.config, 'QUERY_COUNT_DEBUG', True)
+    return client
+
+
+def test_query_count_header_present(debug_client, seed_urls):
+    seed_urls(10)
+    response = debug_client.get('/')
+    assert int(response.headers['X-Query-Count']) > 0
+    assert float(response.headers['X-Query-Time-Ms']) >= 0
+
+
+def test_query_count_constant_as_collection_grows(debug_client, seed_urls):
+    n = 30
+    seed_urls(n)
+    small = query_counts(debug_client)
+
+    seed_urls(n * 9)    # ab 10 x N
+    large = query_counts(debug_client)
+
+    assert large == small
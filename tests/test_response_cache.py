@@ -0,0 +1,31 @@
+from response_cache import LocalGeneration
+
+
+def test_conditional_get_returns_304_until_data_changes(client, seed_urls):
+    seed_urls(3)
+    first = client.get('/')
+    assert first.status_code == 200 and first.headers['ETag']
+    etag = first.headers['ETag']
+
+    assert client.get('/', headers={'If-None-Match': etag}).status_code == 304
+
+    seed_urls(2)    # generation++ -> naya ETag, poora page
+    changed = client.get('/', headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != etag
+
+
+def test_etag_does_not_repeat_after_restart(app, client, seed_urls, monkeypatch):
+    # Restart: local counter phir 0 se - purane process ka ETag match nahi hona chahiye
+    store = app.extensions['response_cache']
+    monkeypatch.setattr(store, 'generation', LocalGeneration())
+    store.clear()
+    etag = client.get('/').headers['ETag']
+
+    seed_urls(2)
+    monkeypatch.setattr(store, 'generation', LocalGeneration())
+    store.clear()
+
+    response = client.get('/', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert b'Page 1' in response.data
@@ -0,0 +1,138 @@
+import os
+import sys
+import errno
+import time
+import types
+import threading
+from datetime import timedelta
+
+import pytest
+
+import app as app_module
+from bulk_import import import_records
+from models import db, Tag, URL, User
+from title_worker import TitleWorker
+
+
+def test_init_db_is_idempotent(app):
+    with app.app_context():
+        app_module.init_db()
+        app_module.init_db()
+        assert db.session.query(Tag).count() == len(app_module.DEFAULT_TAGS)
+        assert db.session.query(User).filter_by(email=app_module.DEFAULT_USER_EMAIL).count() == 1
+
+
+def test_init_lock_without_fcntl_uses_msvcrt(app, monkeypatch):
+    # Windows jaisa: fcntl import nahi hota, msvcrt byte lock lagta hai
+    calls = []
+    msvcrt = types.SimpleNamespace(LK_LOCK=1, LK_UNLCK=0,
+                                   locking=lambda fd, mode, size: calls.append(mode))
+    monkeypatch.setitem(sys.modules, 'fcntl', None)
+    monkeypatch.setitem(sys.modules, 'msvcrt', msvcrt)
+
+    with app.app_context():
+        app_module.init_db()
+
+    assert calls == [msvcrt.LK_LOCK, msvcrt.LK_UNLCK]
+
+
+def fake_msvcrt(errors, calls):
+    # errors: har LK_LOCK call pe raise karne wale errno (phir success)
+    def locking(fd, mode, size):
+        calls.append(mode)
+        if mode == 1 and errors:
+            code = errors.pop(0)
+            raise OSError(code, os.strerror(code))
+    return types.SimpleNamespace(LK_LOCK=1, LK_UNLCK=0, locking=locking)
+
+
+def test_msvcrt_lock_retries_only_while_contended(app, monkeypatch, tmp_path):
+    monkeypatch.setitem(sys.modules, 'fcntl', None)
+
+    calls = []
+    monkeypatch.setitem(sys.modules, 'msvcrt', fake_msvcrt([errno.EDEADLOCK, errno.EACCES], calls))
+    with open(tmp_path / 'busy.lock', 'a+') as lock_file:
+        app_module.lock_file_exclusive(lock_file)
+    assert calls == [1, 1, 1]
+
+    calls = []
+    monkeypatch.setitem(sys.modules, 'msvcrt', fake_msvcrt([errno.EBADF], calls))
+    with open(tmp_path / 'broken.lock', 'a+') as lock_file:
+        with pytest.raises(OSError):
+            app_module.lock_file_exclusive(lock_file)
+    assert calls == [1]
+
+
+def add_pending(app, count):
+    with app.app_context():
+        import_records([{'url': f'https://pending.example/{i}', 'tags': []} for i in range(count)])
+
+
+def test_create_app_does_not_requeue(app):
+    add_pending(app, 2)
+    fresh = app_module.create_app({'SQLALCHEMY_DATABASE_URI': app.config['SQLALCHEMY_DATABASE_URI'],
+                                   'SECRET_KEY': 'test-secret-key'})
+    assert fresh.extensions['title_worker'].outstanding_ids() == []
+    with fresh.app_context():
+        assert URL.query.filter(URL.title_claimed_at.isnot(None)).count() == 0
+
+
+def test_pending_titles_claimed_once_until_lease_expires(app, monkeypatch):
+    add_pending(app, 3)
+    submitted = []
+    monkeypatch.setattr(app.extensions['title_worker'], 'submit', lambda url_id, url: submitted.append(url))
+
+    with app.app_context():
+        assert app_module.requeue_pending_titles() == 3     # pehla worker
+        assert app_module.requeue_pending_titles() == 0     # baaki workers - lease zinda hai
+        assert len(submitted) == 3
+
+        # Worker mar gaya, lease renew nahi hua
+        db.session.execute(db.update(URL).values(
+            title_claimed_at=URL.title_claimed_at - timedelta(seconds=app_module.TITLE_LEASE_SECONDS + 1)))
+        db.session.commit()
+        assert app_module.requeue_pending_titles() == 3
+
+
+def test_renewed_lease_keeps_claim(app, monkeypatch):
+    add_pending(app, 1)
+    monkeypatch.setattr(app.extensions['title_worker'], 'submit', lambda url_id, url: None)
+    with app.app_context():
+        app_module.requeue_pending_titles()
+        url = URL.query.one()
+        url.title_claimed_at -= timedelta(seconds=app_module.TITLE_LEASE_SECONDS + 1)
+        db.session.commit()
+        url_id = url.id
+
+    app_module.renew_title_leases(app, [url_id])     # busy worker ka heartbeat
+    with app.app_context():
+        assert app_module.requeue_pending_titles() == 0
+
+
+def test_title_worker_heartbeat_renews_outstanding():
+    release = threading.Event()
+    leased = []
+    worker = TitleWorker(lambda url: release.wait(5) and 'Title', lambda *args: None,
+                         on_lease=leased.append, lease_interval=0.05)
+    worker.submit(7, 'https://slow.example/')
+    try:
+        deadline = time.time() + 5
+        while not leased and time.time() < deadline:
+            time.sleep(0.01)
+        assert leased[0] == [7]
+    finally:
+        release.set()
+        worker.wait_idle(5)
+        worker.shutdown()
+    assert worker.outstanding_ids() == []
+
+
+def test_add_and_import_claim_their_own_titles(app, client, monkeypatch):
+    monkeypatch.setattr(app.extensions['title_worker'], 'submit', lambda url_id, url: None)
+    client.post('/add', data={'url': 'https://added.example/'})
+    with app.app_context():
+        import_records([{'url': 'https://imported.example/', 'tags': []}], on_pending=lambda url_id, url: None)
+        import_records([{'url': 'https://unqueued.example/', 'tags': []}])
+        claimed = {url.url: url.title_claimed_at is not None for url in URL.query}
+    assert claimed == {'https://added.example/': True, 'https://imported.example/': True,
+                       'https://unqueued.example/': False}
@@ -0,0 +1,104 @@
+import os
+import re
+import html
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from cachetools import TTLCache
+
+from urlnorm import normalize_url
+
+
+# ✅ CONFIG - env se override kar sakte ho
+MAX_BYTES = int(os.environ.get('TITLE_MAX_BYTES', 256 * 1024))   # isse zyada kabhi nahi padhenge
+CHUNK_SIZE = 8 * 1024
+TIMEOUT = float(os.environ.get('TITLE_FETCH_TIMEOUT', 5))
+CACHE_SIZE = int(os.environ.get('TITLE_CACHE_SIZE', 2048))
+CACHE_TTL = int(os.environ.get('TITLE_CACHE_TTL', 6 * 60 * 60))
+
+NO_TITLE = "No title found"
+
+TITLE_RE = re.compile(rb'<title[^>]*>(.*?)</title', re.IGNORECASE | re.DOTALL)
+STOP_RE = re.compile(rb'</title|</head', re.IGNORECASE)
+CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+
+# ✅ POOLED SESSION - har fetch pe naya TCP/TLS connection nahi
+def _make_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = 'Mozilla/5.0'
+    return session
+
+session = _make_session()
+
+# ✅ TITLE CACHE - normalized URL -> title, bounded size + TTL
+_cache = TTLCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
+_cache_lock = threading.Lock()
+
+
+def _decode(raw, response):
+    # Header wala charset > <meta charset> > utf-8
+    content_type = response.headers.get('Content-Type', '')
+    encoding = None
+    if 'charset=' in content_type.lower():
+        encoding = response.encoding
+    if not encoding:
+        match = CHARSET_RE.search(raw)
+        encoding = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        return raw.decode(encoding, errors='replace')
+    except LookupError:
+        return raw.decode('utf-8', errors='replace')
+
+
+def read_head(response, max_bytes=MAX_BYTES):
+    # Stream karo aur </title> ya </head> milte hi ruk jao - poora page download nahi
+    buffer = b''
+    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+        # Chunk boundary pe tag toot sakta hai - thoda pichla hissa bhi scan karo
+        search_from = max(len(buffer) - 8, 0)
+        buffer += chunk
+        if STOP_RE.search(buffer, search_from) or len(buffer) >= max_bytes:
+            break
+    return buffer[:max_bytes]
+
+
+def extract_title(raw, response):
+    match = TITLE_RE.search(raw)
+    if not match:
+        return NO_TITLE
+    title = ' '.join(html.unescape(_decode(match.group(1), response)).split())
+    return title[:200] or NO_TITLE
+
+
+def fetch_title(url, use_cache=True):
+    key = normalize_url(url)
+    if use_cache:
+        with _cache_lock:
+            cached = _cache.get(key)
+        if cached is not None:
+            return cached
+
+    with session.get(url, stream=True, timeout=TIMEOUT) as response:
+        # 5xx / 429 temporary hai - exception se caller retry karega
+        if response.status_code >= 500 or response.status_code == 429:
+            response.raise_for_status()
+
+        content_type = response.headers.get('Content-Type', 'text/html').lower()
+        if 'html' not in content_type and 'xml' not in content_type:
+            title = NO_TITLE    # PDF / image etc. - body padhne ki zarurat nahi
+        else:
+            title = extract_title(read_head(response), response)
+
+    with _cache_lock:
+        _cache[key] = title
+    return title
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,137 @@
+import random
+import logging
+import threading
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+log = logging.getLogger('url_manager.title_worker')
+
+# ✅ BACKGROUND TITLE FETCHER
+# /add turant return karta hai - title yahan thread pool me fetch hota hai.
+# Har host pe max `per_host` requests ek saath, baaki us host ki queue me wait karti hain
+# (pool ke threads block nahi hote). Fail hone pe exponential backoff ke saath retry.
+# on_lease diya ho to har lease_interval seconds pe jo url ids abhi queue / retry me
+# hain unke saath call hota hai - DB me unka claim zinda rakhne ke liye (app.py).
+class TitleWorker:
+    def __init__(self, fetch, on_result, max_workers=8, per_host=2,
+                 retries=3, backoff=1.0, on_lease=None, lease_interval=60.0):
+        self.fetch = fetch            # fetch(url) -> title, error pe exception
+        self.on_result = on_result    # on_result(url_id, title, status)
+        self.on_lease = on_lease      # on_lease([url_id, ...])
+        self.lease_interval = lease_interval
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.retries = retries
+        self.backoff = backoff
+
+        self._executor = None
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._outstanding = 0                  # submit hue jobs jinka final result nahi aaya
+        self._jobs = Counter()                 # url_id -> outstanding jobs
+        self._heartbeat = None
+        self._stopped = threading.Event()
+        self._active = defaultdict(int)        # host -> running jobs
+        self._waiting = defaultdict(deque)     # host -> queued jobs
+
+    def _get_executor(self):
+        # Lazy - gunicorn --preload me fork se pehle bane threads child me nahi chalte
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix='title-fetch')
+            if self.on_lease and self._heartbeat is None:
+                self._stopped.clear()
+                self._heartbeat = threading.Thread(target=self._renew_leases,
+                                                   name='title-lease', daemon=True)
+                self._heartbeat.start()
+        return self._executor
+
+    def outstanding_ids(self):
+        with self._lock:
+            return list(self._jobs)
+
+    def _renew_leases(self):
+        while not self._stopped.wait(self.lease_interval):
+            url_ids = self.outstanding_ids()
+            if not url_ids:
+                continue
+            try:
+                self.on_lease(url_ids)
+            except Exception as e:
+                log.exception('title lease renewal failed jobs=%d error=%s', len(url_ids), e)
+
+    def submit(self, url_id, url, attempt=0):
+        host = urlparse(url).hostname or ''
+        job = (url_id, url, attempt)
+        with self._lock:
+            if attempt == 0:
+                self._outstanding += 1
+                self._jobs[url_id] += 1
+            if self._active[host] >= self.per_host:
+                self._waiting[host].append(job)
+                return
+            self._active[host] += 1
+        self._get_executor().submit(self._run, host, job)
+
+    def _run(self, host, job):
+        url_id, url, attempt = job
+        try:
+            title = self.fetch(url)
+        except Exception as e:
+            if attempt + 1 < self.retries:
+                # 1s, 2s, 4s ... + jitter taaki saare retries ek saath na girein
+                delay = self.backoff * (2 ** attempt) * (1 + random.random() / 2)
+                log.debug('title fetch retry url_id=%s attempt=%d delay=%.2f error=%s',
+                          url_id, attempt + 1, delay, e)
+                timer = threading.Timer(delay, self.submit, (url_id, url, attempt + 1))
+                timer.daemon = True
+                timer.start()
+            else:
+                self._store(url_id, None, 'failed')
+                log.warning('title fetch failed url_id=%s attempts=%d error=%s',
+                            url_id, attempt + 1, e)
+        else:
+            self._store(url_id, title, 'ready')
+        finally:
+            self._release(host)
+
+    def _store(self, url_id, title, status):
+        try:
+            self.on_result(url_id, title, status)
+        except Exception as e:
+            log.exception('saving title failed url_id=%s error=%s', url_id, e)
+        finally:
+            with self._lock:
+                self._outstanding -= 1
+                self._jobs[url_id] -= 1
+                if not self._jobs[url_id]:
+                    del self._jobs[url_id]
+                if not self._outstanding:
+                    self._idle.notify_all()
+
+    def wait_idle(self, timeout=None):
+        # CLI scripts (bulk import) ke liye - saare titles aane tak ruko
+        with self._lock:
+            return self._idle.wait_for(lambda: not self._outstanding, timeout)
+
+    def _release(self, host):
+        with self._lock:
+            queue = self._waiting[host]
+            if queue:
+                # Slot khali hua - isi host ka agla job chalao
+                next_job = queue.popleft()
+            else:
+                self._active[host] -= 1
+                if not self._active[host]:
+                    del self._active[host]
+                    del self._waiting[host]
+                return
+        self._get_executor().submit(self._run, host, next_job)
+
+    def shutdown(self, wait=True):
+        self._stopped.set()
+        self._heartbeat = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
@@ -0,0 +1,22 @@
+import hashlib
+from urllib.parse import urlsplit, urlunsplit
+
+
+# ✅ URL NORMALIZATION - duplicate detection aur title cache dono ke liye
+def normalize_url(url, parts=None):
+    # Scheme/host lowercase, default port aur #fragment hatao, khali path -> '/'
+    # (parts: caller ke paas pehle se urlsplit() ho to dobara parse mat karo)
+    parts = parts or urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    port = parts.port
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f'{host}:{port}'
+    if parts.username:
+        host = f'{parts.username}@{host}'
+    return urlunsplit((scheme, host, parts.path or '/', parts.query, ''))
+
+
+def url_hash(url, parts=None):
+    # url.url_hash column (unique index) - sha256 of normalized URL
+    return hashlib.sha256(normalize_url(url, parts).encode('utf-8')).hexdigest()